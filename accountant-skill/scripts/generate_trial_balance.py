@@ -10,7 +10,9 @@ Produces a Trial Balance workbook containing:
   - Dashboard                 (Dr=Cr validation for both TB columns)
 
 Usage:
-    python generate_trial_balance.py <ledgers_dir> <output_dir> <period_start> <period_end> <output_file>
+    python generate_trial_balance.py <ledgers_dir> <output_dir> <period_start> <period_end> <output_file> [--verbose]
+
+    --verbose  also print each adjusting entry and the Dr/Cr totals of both TBs
 
     python generate_trial_balance.py \\
         data/input/ledgers \\
@@ -22,7 +24,8 @@ Usage:
 Output sheets:
     Dashboard     -- totals, Dr=Cr validation for unadjusted and adjusted TB
     Unadjusted TB -- GL closing balances before adjustments
-    Adjustments   -- ADJ- entries (individual journal list + per-account summary)
+    Adjustments   -- ADJ- entries (individual journal list + per-account summary;
+                     only if adjusting entries were found)
     Adjusted TB   -- balances after applying all adjusting entries
     TB Worksheet  -- 6-column combined worksheet view
     Exceptions    -- (only if errors found)
@@ -30,6 +33,8 @@ Output sheets:
 
 import sys
 import os
+import math
+from operator import itemgetter
 from pathlib import Path
 
 import pandas as pd
@@ -39,7 +44,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 from utils.excel_reader import read_all_sheets
 from utils.excel_writer import (
     create_workbook, add_sheet, write_title, write_header_row,
-    write_data_row, write_section_header, write_total_row,
+    write_data_row, write_data_rows, write_section_header, write_total_row,
     write_validation_result, auto_fit_columns, freeze_panes,
     save_workbook, NORMAL_FONT, TOTAL_FONT, THIN_BORDER,
     PASS_FILL, FAIL_FILL
@@ -270,6 +275,9 @@ def load_gl_balances(data_dir, period_start, period_end, coa):
 # 2. Load Adjusting Entries from Module 4 output
 # ---------------------------------------------------------------------------
 
+HEADER_SCAN_ROWS = 20   # Rows read to find the 'All Entries' header row
+
+
 def load_adj_entries(data_dir):
     """
     Read the 'All Entries' sheet from adjusting_entries_*.xlsx.
@@ -278,27 +286,38 @@ def load_adj_entries(data_dir):
 
     Returns: (list of entry dicts, error string or None)
     """
-    data_dir   = Path(data_dir)
-    candidates = list(data_dir.glob('adjusting_entries*.xlsx'))
+    try:
+        with os.scandir(data_dir) as it:
+            candidates = sorted(e.path for e in it
+                                if e.name.startswith('adjusting_entries')
+                                and e.name.endswith('.xlsx') and e.is_file())
+    except OSError:
+        candidates = []
     if not candidates:
         return [], "No adjusting_entries*.xlsx found -- adjustments skipped."
 
-    adj_file = candidates[0]
+    adj_file = Path(candidates[0])
 
     try:
-        # Detect header row: scan for a row containing 'Dr Code' or 'Entry No.'
-        df_raw = pd.read_excel(adj_file, sheet_name='All Entries', header=None)
-        header_row_idx = None
-        for i, row_vals in df_raw.iterrows():
-            row_strs = [str(v).strip() for v in row_vals.values]
-            if 'Dr Code' in row_strs or 'Entry No.' in row_strs:
-                header_row_idx = i
-                break
-        if header_row_idx is None:
-            return [], (f"Could not find header row in 'All Entries' sheet "
-                        f"of {adj_file.name}")
-
-        df = pd.read_excel(adj_file, sheet_name='All Entries', header=header_row_idx)
+        with pd.ExcelFile(adj_file) as xf:
+            # Detect header row: scan for a row containing 'Dr Code' or
+            # 'Entry No.', reading only the top of the sheet unless the title
+            # block is unusually long
+            header_row_idx = None
+            for nrows in (HEADER_SCAN_ROWS, None):
+                df_raw = xf.parse('All Entries', header=None, nrows=nrows)
+                for i, row_vals in df_raw.iterrows():
+                    row_strs = [str(v).strip() for v in row_vals.values]
+                    if 'Dr Code' in row_strs or 'Entry No.' in row_strs:
+                        header_row_idx = i
+                        break
+                if header_row_idx is not None:
+                    break
+            if header_row_idx is None:
+                return [], (f"Could not find header row in 'All Entries' sheet "
+                            f"of {adj_file.name}")
+
+            df = xf.parse('All Entries', header=header_row_idx)
     except Exception as e:
         return [], f"Could not read 'All Entries' from {adj_file.name}: {e}"
 
@@ -342,6 +361,15 @@ def load_adj_entries(data_dir):
     return entries, None
 
 
+_adj_amounts = itemgetter('dr_amount', 'cr_amount')
+
+
+def _adj_arrays(adj_entries):
+    """Return {'dr_amount': float64 array, 'cr_amount': float64 array} for the entries."""
+    mat = np.array(list(map(_adj_amounts, adj_entries)), dtype=np.float64).reshape(-1, 2)
+    return {'dr_amount': mat[:, 0].copy(), 'cr_amount': mat[:, 1].copy()}
+
+
 # ---------------------------------------------------------------------------
 # 3. Build Trial Balance Rows
 # ---------------------------------------------------------------------------
@@ -358,6 +386,24 @@ def _tb_display(balance, normal_bal):
         return (None, b) if b >= 0 else (abs(b), None)
 
 
+TB_AMOUNT_KEYS = ('unadj_dr', 'unadj_cr', 'adj_entries_dr', 'adj_entries_cr',
+                  'adj_dr', 'adj_cr')
+
+
+_tb_amounts = itemgetter(*TB_AMOUNT_KEYS)
+
+
+def _tb_arrays(tb_rows):
+    """Return {key: float64 array} for each TB amount column (blanks as 0.0)."""
+    # One C-level itemgetter pass. Only blank (None) amounts become 0.0; a NaN
+    # or inf amount is kept so the totals and the balance check expose it
+    mat = np.array(list(map(_tb_amounts, tb_rows)), dtype=object)
+    mat = mat.reshape(-1, len(TB_AMOUNT_KEYS))
+    mat[np.equal(mat, None)] = 0.0
+    mat = mat.astype(np.float64).T.copy()
+    return dict(zip(TB_AMOUNT_KEYS, mat))
+
+
 def build_tb_rows(gl_balances, adj_entries, coa):
     """
     Combine GL balances + adjusting entries to produce trial balance rows.
@@ -368,7 +414,8 @@ def build_tb_rows(gl_balances, adj_entries, coa):
       adj_cr_tot = sum of all ADJ credits to this account
       adj_bal    = unadj_bal +/- net adjustments (sign depends on normal balance)
 
-    Returns: list of row dicts sorted by account code.
+    Returns: (list of row dicts sorted by account code,
+              dict of float64 column arrays keyed by TB_AMOUNT_KEYS)
     """
     # Aggregate adjustments per account code
     adj_dr_map = {}   # code_int -> total Dr
@@ -444,26 +491,50 @@ def build_tb_rows(gl_balances, adj_entries, coa):
             'adj_cr':         adj_cr,
         })
 
-    return rows
+    return rows, _tb_arrays(rows)
+
+
+def build_tb_sheet_rows(tb_rows):
+    """
+    Format every account once for the three per-account TB sheets.
+
+    Returns dict of row-value lists:
+      'unadjusted' / 'adjusted' -> [code, name, type, normal balance, Dr, Cr]
+      'worksheet'               -> [code, name, type, unadj Dr/Cr, adj entries Dr/Cr,
+                                    adjusted Dr/Cr]
+    """
+    unadjusted, adjusted, worksheet = [], [], []
+    for r in tb_rows:
+        head   = [r['code'], r['name'], r['type']]
+        normal = r['normal_balance'].capitalize()
+        u_dr, u_cr = _n(r['unadj_dr']), _n(r['unadj_cr'])
+        f_dr, f_cr = _n(r['adj_dr']),   _n(r['adj_cr'])
+        unadjusted.append(head + [normal, u_dr, u_cr])
+        adjusted.append(head + [normal, f_dr, f_cr])
+        worksheet.append(head + [u_dr, u_cr,
+                                 _n(r['adj_entries_dr']), _n(r['adj_entries_cr']),
+                                 f_dr, f_cr])
+    return {'unadjusted': unadjusted, 'adjusted': adjusted, 'worksheet': worksheet}
 
 
 # ---------------------------------------------------------------------------
 # 4. Write Dashboard
 # ---------------------------------------------------------------------------
 
-def write_dashboard(wb, tb_rows, adj_entries, period_start, period_end, exceptions):
+def write_dashboard(wb, tb_rows, tb_cols, adj_entries, adj_cols, period_start, period_end,
+                    exceptions):
     ws         = add_sheet(wb, 'Dashboard', tab_color='00B050')
     period_str = f"{period_start}  to  {period_end}"
     row        = write_title(ws, 'Trial Balance -- Dashboard',
                              'Shwe Mandalay Cafe', period_str)
 
     # Totals
-    unadj_dr_tot = sum(r['unadj_dr'] for r in tb_rows if r['unadj_dr'])
-    unadj_cr_tot = sum(r['unadj_cr'] for r in tb_rows if r['unadj_cr'])
-    adj_dr_tot   = sum(r['adj_dr']   for r in tb_rows if r['adj_dr'])
-    adj_cr_tot   = sum(r['adj_cr']   for r in tb_rows if r['adj_cr'])
-    adj_entr_dr  = sum(e['dr_amount'] for e in adj_entries)
-    adj_entr_cr  = sum(e['cr_amount'] for e in adj_entries)
+    unadj_dr_tot = math.fsum(tb_cols['unadj_dr'])
+    unadj_cr_tot = math.fsum(tb_cols['unadj_cr'])
+    adj_dr_tot   = math.fsum(tb_cols['adj_dr'])
+    adj_cr_tot   = math.fsum(tb_cols['adj_cr'])
+    adj_entr_dr  = math.fsum(adj_cols['dr_amount'])
+    adj_entr_cr  = math.fsum(adj_cols['cr_amount'])
 
     unadj_ok   = abs(unadj_dr_tot - unadj_cr_tot) < 0.01
     adj_ok     = abs(adj_dr_tot   - adj_cr_tot)   < 0.01
@@ -527,7 +598,7 @@ def write_dashboard(wb, tb_rows, adj_entries, period_start, period_end, exceptio
 # 5. Write Unadjusted Trial Balance
 # ---------------------------------------------------------------------------
 
-def write_unadjusted_tb(wb, tb_rows, period_start, period_end):
+def write_unadjusted_tb(wb, tb_sheet_rows, tb_cols, period_start, period_end):
     ws  = add_sheet(wb, 'Unadjusted TB', tab_color='4472C4')
     row = write_title(ws, 'Unadjusted Trial Balance',
                       'GL closing balances before adjusting entries',
@@ -536,14 +607,9 @@ def write_unadjusted_tb(wb, tb_rows, period_start, period_end):
     headers = ['Account Code', 'Account Name', 'Type', 'Normal Balance', 'Debit', 'Credit']
     row     = write_header_row(ws, headers, row)
 
-    total_dr = total_cr = 0.0
-    for r in tb_rows:
-        row = write_data_row(ws, [
-            r['code'], r['name'], r['type'], r['normal_balance'].capitalize(),
-            _n(r['unadj_dr']), _n(r['unadj_cr']),
-        ], row, number_cols=[5, 6])
-        total_dr += r['unadj_dr'] or 0.0
-        total_cr += r['unadj_cr'] or 0.0
+    row = write_data_rows(ws, tb_sheet_rows['unadjusted'], row, number_cols=[5, 6])
+    total_dr = math.fsum(tb_cols['unadj_dr'])
+    total_cr = math.fsum(tb_cols['unadj_cr'])
 
     row = write_total_row(ws, 'TOTAL',
                           [None, None, None, _n(total_dr), _n(total_cr)],
@@ -568,7 +634,7 @@ def write_unadjusted_tb(wb, tb_rows, period_start, period_end):
 # 6. Write Adjustments Sheet
 # ---------------------------------------------------------------------------
 
-def write_adjustments_sheet(wb, adj_entries, tb_rows, period_end):
+def write_adjustments_sheet(wb, adj_entries, adj_cols, tb_rows, period_end):
     ws  = add_sheet(wb, 'Adjustments', tab_color='4472C4')
     row = write_title(ws, 'Adjustments -- ADJ- Journal Entries',
                       'Period-end adjusting entries applied to the Trial Balance',
@@ -586,15 +652,13 @@ def write_adjustments_sheet(wb, adj_entries, tb_rows, period_end):
                'Credit Account', 'Cr Code', 'Credit Amount']
     row = write_header_row(ws, headers, row)
 
-    total_dr = total_cr = 0.0
-    for e in adj_entries:
-        row = write_data_row(ws, [
-            e['ref'], _fmt_date(e['date']), e['type'], e['description'],
-            e['dr_name'], e['dr_code'], _n(e['dr_amount']),
-            e['cr_name'], e['cr_code'], _n(e['cr_amount']),
-        ], row, number_cols=[7, 10])
-        total_dr += e['dr_amount']
-        total_cr += e['cr_amount']
+    row = write_data_rows(ws, ([
+        e['ref'], _fmt_date(e['date']), e['type'], e['description'],
+        e['dr_name'], e['dr_code'], _n(e['dr_amount']),
+        e['cr_name'], e['cr_code'], _n(e['cr_amount']),
+    ] for e in adj_entries), row, number_cols=[7, 10])
+    total_dr = math.fsum(adj_cols['dr_amount'])
+    total_cr = math.fsum(adj_cols['cr_amount'])
 
     row = write_total_row(ws, 'TOTAL',
                           [None, None, None, None, None, _n(total_dr),
@@ -631,7 +695,7 @@ def write_adjustments_sheet(wb, adj_entries, tb_rows, period_end):
 # 7. Write Adjusted Trial Balance
 # ---------------------------------------------------------------------------
 
-def write_adjusted_tb(wb, tb_rows, period_start, period_end):
+def write_adjusted_tb(wb, tb_sheet_rows, tb_cols, period_start, period_end):
     ws  = add_sheet(wb, 'Adjusted TB', tab_color='4472C4')
     row = write_title(ws, 'Adjusted Trial Balance',
                       'GL balances after applying all adjusting entries',
@@ -640,14 +704,9 @@ def write_adjusted_tb(wb, tb_rows, period_start, period_end):
     headers = ['Account Code', 'Account Name', 'Type', 'Normal Balance', 'Debit', 'Credit']
     row     = write_header_row(ws, headers, row)
 
-    total_dr = total_cr = 0.0
-    for r in tb_rows:
-        row = write_data_row(ws, [
-            r['code'], r['name'], r['type'], r['normal_balance'].capitalize(),
-            _n(r['adj_dr']), _n(r['adj_cr']),
-        ], row, number_cols=[5, 6])
-        total_dr += r['adj_dr'] or 0.0
-        total_cr += r['adj_cr'] or 0.0
+    row = write_data_rows(ws, tb_sheet_rows['adjusted'], row, number_cols=[5, 6])
+    total_dr = math.fsum(tb_cols['adj_dr'])
+    total_cr = math.fsum(tb_cols['adj_cr'])
 
     row = write_total_row(ws, 'TOTAL',
                           [None, None, None, _n(total_dr), _n(total_cr)],
@@ -672,7 +731,7 @@ def write_adjusted_tb(wb, tb_rows, period_start, period_end):
 # 8. Write TB Worksheet (6-column combined view)
 # ---------------------------------------------------------------------------
 
-def write_tb_worksheet(wb, tb_rows, period_start, period_end):
+def write_tb_worksheet(wb, tb_sheet_rows, tb_cols, period_start, period_end):
     ws  = add_sheet(wb, 'TB Worksheet', tab_color='70AD47')
     row = write_title(ws, 'Trial Balance Worksheet',
                       'Unadjusted  |  Adjustments  |  Adjusted',
@@ -684,26 +743,11 @@ def write_tb_worksheet(wb, tb_rows, period_start, period_end):
                'Adjusted Debit', 'Adjusted Credit']
     row = write_header_row(ws, headers, row)
 
-    t = [0.0] * 6   # [unadj_dr, unadj_cr, adj_e_dr, adj_e_cr, final_dr, final_cr]
-
-    for r in tb_rows:
-        u_dr = r['unadj_dr']       or 0.0
-        u_cr = r['unadj_cr']       or 0.0
-        a_dr = r['adj_entries_dr'] or 0.0
-        a_cr = r['adj_entries_cr'] or 0.0
-        f_dr = r['adj_dr']         or 0.0
-        f_cr = r['adj_cr']         or 0.0
+    # [unadj_dr, unadj_cr, adj_e_dr, adj_e_cr, final_dr, final_cr]
+    t = [math.fsum(tb_cols[k]) for k in TB_AMOUNT_KEYS]
 
-        row = write_data_row(ws, [
-            r['code'], r['name'], r['type'],
-            _n(u_dr), _n(u_cr),
-            _n(a_dr), _n(a_cr),
-            _n(f_dr), _n(f_cr),
-        ], row, number_cols=[4, 5, 6, 7, 8, 9])
-
-        t[0] += u_dr; t[1] += u_cr
-        t[2] += a_dr; t[3] += a_cr
-        t[4] += f_dr; t[5] += f_cr
+    row = write_data_rows(ws, tb_sheet_rows['worksheet'], row,
+                          number_cols=[4, 5, 6, 7, 8, 9])
 
     row = write_total_row(ws, 'TOTAL',
                           [None, None,
@@ -749,22 +793,26 @@ def write_exceptions_sheet(wb, exceptions):
 # ---------------------------------------------------------------------------
 
 def main():
-    if len(sys.argv) < 6:
+    verbose = '--verbose' in sys.argv
+    args    = [a for a in sys.argv[1:] if a != '--verbose']
+    if len(args) < 5:
         print(__doc__)
         sys.exit(1)
 
-    ledgers_dir  = sys.argv[1]
-    output_dir   = sys.argv[2]
-    period_start = sys.argv[3]
-    period_end   = sys.argv[4]
-    output_file  = sys.argv[5]
-
-    print(f"\n{'='*60}")
-    print(f"  MODULE 5 -- GENERATE TRIAL BALANCE")
-    print(f"  Period : {period_start}  to  {period_end}")
-    print(f"  Ledgers: {ledgers_dir}")
-    print(f"  Output : {output_file}")
-    print(f"{'='*60}\n")
+    ledgers_dir  = args[0]
+    output_dir   = args[1]
+    period_start = args[2]
+    period_end   = args[3]
+    output_file  = args[4]
+
+    sys.stdout.write('\n'.join([
+        f"\n{'='*60}",
+        f"  MODULE 5 -- GENERATE TRIAL BALANCE",
+        f"  Period : {period_start}  to  {period_end}",
+        f"  Ledgers: {ledgers_dir}",
+        f"  Output : {output_file}",
+        f"{'='*60}\n",
+    ]) + '\n')
 
     coa_path = Path(ledgers_dir) / 'chart_of_accounts.xlsx'
     # Try master dir if not in ledgers_dir
@@ -786,38 +834,39 @@ def main():
     # ── 2. Adjusting entries ─────────────────────────────────────────────────
     print("\nLoading adjusting entries...")
     adj_entries, warn = load_adj_entries(output_dir)
+    adj_cols = _adj_arrays(adj_entries)
     if warn:
         print(f"  WARNING: {warn}")
         exceptions.append(warn)
     else:
-        total_adj = sum(e['dr_amount'] for e in adj_entries)
+        total_adj = math.fsum(adj_cols['dr_amount'])
         print(f"  Adjusting entries  : {len(adj_entries)}")
         print(f"  Total adj amount   : {total_adj:,.2f}")
-        for e in adj_entries:
-            print(f"    {e['ref']:<10}  Dr {e['dr_code']}  "
-                  f"Cr {e['cr_code']}  {e['dr_amount']:>10,.2f}")
+        if verbose and adj_entries:
+            print('\n'.join(f"    {e['ref']:<10}  Dr {e['dr_code']}  "
+                            f"Cr {e['cr_code']}  {e['dr_amount']:>10,.2f}"
+                            for e in adj_entries))
 
     # ── 3. Build TB rows ─────────────────────────────────────────────────────
     print("\nBuilding trial balance...")
-    tb_rows = build_tb_rows(gl_balances, adj_entries, coa)
+    tb_rows, tb_cols = build_tb_rows(gl_balances, adj_entries, coa)
     print(f"  TB accounts: {len(tb_rows)}")
 
-    unadj_dr = sum(r['unadj_dr'] or 0.0 for r in tb_rows)
-    unadj_cr = sum(r['unadj_cr'] or 0.0 for r in tb_rows)
-    adj_dr   = sum(r['adj_dr']   or 0.0 for r in tb_rows)
-    adj_cr   = sum(r['adj_cr']   or 0.0 for r in tb_rows)
-
-    print(f"\n  Unadjusted TB:")
-    print(f"    Total Debit  : {unadj_dr:>15,.2f}")
-    print(f"    Total Credit : {unadj_cr:>15,.2f}")
-    print(f"    Difference   : {unadj_dr - unadj_cr:>15,.2f}")
-    print(f"    Balanced     : {'YES' if abs(unadj_dr - unadj_cr) < 0.01 else 'NO'}")
-
-    print(f"\n  Adjusted TB:")
-    print(f"    Total Debit  : {adj_dr:>15,.2f}")
-    print(f"    Total Credit : {adj_cr:>15,.2f}")
-    print(f"    Difference   : {adj_dr - adj_cr:>15,.2f}")
-    print(f"    Balanced     : {'YES' if abs(adj_dr - adj_cr) < 0.01 else 'NO'}")
+    unadj_dr = math.fsum(tb_cols['unadj_dr'])
+    unadj_cr = math.fsum(tb_cols['unadj_cr'])
+    adj_dr   = math.fsum(tb_cols['adj_dr'])
+    adj_cr   = math.fsum(tb_cols['adj_cr'])
+
+    if verbose:
+        lines = []
+        for label, dr, cr in [('Unadjusted TB', unadj_dr, unadj_cr),
+                              ('Adjusted TB',   adj_dr,   adj_cr)]:
+            lines += [f"\n  {label}:",
+                      f"    Total Debit  : {dr:>15,.2f}",
+                      f"    Total Credit : {cr:>15,.2f}",
+                      f"    Difference   : {dr - cr:>15,.2f}",
+                      f"    Balanced     : {'YES' if abs(dr - cr) < 0.01 else 'NO'}"]
+        sys.stdout.write('\n'.join(lines) + '\n')
 
     if abs(unadj_dr - unadj_cr) > 0.01:
         exceptions.append(
@@ -835,27 +884,30 @@ def main():
     print(f"\nWriting output to: {output_file}")
     Path(output_file).parent.mkdir(parents=True, exist_ok=True)
 
-    wb = create_workbook()
-    write_dashboard(wb, tb_rows, adj_entries, period_start, period_end, exceptions)
-    write_unadjusted_tb(wb, tb_rows, period_start, period_end)
-    write_adjustments_sheet(wb, adj_entries, tb_rows, period_end)
-    write_adjusted_tb(wb, tb_rows, period_start, period_end)
-    write_tb_worksheet(wb, tb_rows, period_start, period_end)
+    tb_sheet_rows = build_tb_sheet_rows(tb_rows)
+    wb = create_workbook(write_only=True)
+    write_dashboard(wb, tb_rows, tb_cols, adj_entries, adj_cols,
+                    period_start, period_end, exceptions)
+    write_unadjusted_tb(wb, tb_sheet_rows, tb_cols, period_start, period_end)
+    if adj_entries:
+        write_adjustments_sheet(wb, adj_entries, adj_cols, tb_rows, period_end)
+    write_adjusted_tb(wb, tb_sheet_rows, tb_cols, period_start, period_end)
+    write_tb_worksheet(wb, tb_sheet_rows, tb_cols, period_start, period_end)
     if exceptions:
         write_exceptions_sheet(wb, exceptions)
 
     save_workbook(wb, output_file)
 
-    sheets_written = ('Dashboard | Unadjusted TB | Adjustments | '
-                      'Adjusted TB | TB Worksheet'
-                      + (' | Exceptions' if exceptions else ''))
+    sheets_written = ' | '.join(ws.title for ws in wb.worksheets)
 
-    print(f"\n{'='*60}")
-    print(f"  OUTPUT  : {output_file}")
-    print(f"  Sheets  : {sheets_written}")
-    print(f"  Unadjusted TB  Dr = Cr : {'YES' if abs(unadj_dr - unadj_cr) < 0.01 else 'NO'}")
-    print(f"  Adjusted   TB  Dr = Cr : {'YES' if abs(adj_dr   - adj_cr)   < 0.01 else 'NO'}")
-    print(f"{'='*60}\n")
+    sys.stdout.write('\n'.join([
+        f"\n{'='*60}",
+        f"  OUTPUT  : {output_file}",
+        f"  Sheets  : {sheets_written}",
+        f"  Unadjusted TB  Dr = Cr : {'YES' if abs(unadj_dr - unadj_cr) < 0.01 else 'NO'}",
+        f"  Adjusted   TB  Dr = Cr : {'YES' if abs(adj_dr   - adj_cr)   < 0.01 else 'NO'}",
+        f"{'='*60}\n",
+    ]) + '\n')
 
 
 if __name__ == '__main__':
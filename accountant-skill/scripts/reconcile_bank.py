@@ -26,8 +26,11 @@ Output sheets:
     Exceptions            — (only if validation errors found)
 """
 
+import math
+import re
 import sys
 import os
+from collections import defaultdict, deque, namedtuple
 from pathlib import Path
 from datetime import datetime
 
@@ -36,16 +39,19 @@ import numpy as np
 
 # Add scripts directory to path so utils can be found
 sys.path.insert(0, str(Path(__file__).parent))
-from utils.excel_reader import read_xlsx, filter_by_period
+from utils.excel_reader import read_xlsx
+from utils.file_cache import cached_read
 from utils.excel_writer import (
     create_workbook, add_sheet, write_title, write_header_row,
-    write_data_row, write_section_header, write_total_row,
-    write_validation_result, auto_fit_columns, freeze_panes,
+    write_data_row, write_data_rows, write_section_header, write_total_row,
+    write_validation_result, auto_fit_columns, freeze_panes, stream_sheet,
     save_workbook, NORMAL_FONT, TOTAL_FONT, NEGATIVE_FONT,
     THIN_BORDER, PASS_FILL, FAIL_FILL, WARNING_FILL,
-    NUMBER_FORMAT_NEG, DATE_FORMAT, HEADER_FILL, HEADER_FONT
+    NUMBER_FORMAT_NEG, DATE_FORMAT, HEADER_FILL, HEADER_FONT,
+    PASS_FONT, FAIL_FONT, SECTION_FONT, SECTION_FILL, BOTTOM_BORDER, DOUBLE_BOTTOM,
+    LEFT_ALIGN, RIGHT_ALIGN, CENTER_ALIGN
 )
-from openpyxl.styles import Font, PatternFill, Alignment
+from openpyxl.styles import Font
 from openpyxl.utils import get_column_letter
 
 
@@ -64,19 +70,51 @@ OTHER_INCOME_CODE = '70000'   # Interest Income (catch-all for miscellaneous)
 
 DATE_PROXIMITY_DAYS = 3       # Max days apart for amount-only match
 
+ITEM_COLUMNS = ['Date', 'Reference', 'Description', '_amount']
+
+STATUS_PASS_FONT = Font(bold=True, size=14, name='Arial', color='006100')
+STATUS_FAIL_FONT = Font(bold=True, size=14, name='Arial', color='9C0006')
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # 1. DATA LOADING
 # ─────────────────────────────────────────────────────────────────────────────
 
+def _period_masks(df, period_start, period_end):
+    """
+    Boolean arrays over df's rows: dated before period_start, and dated on
+    or before period_end. The bounds are converted once; undated rows are
+    False in both.
+    """
+    dates = df['Date'].to_numpy(dtype='datetime64[ns]')
+    before = dates < np.datetime64(pd.Timestamp(period_start), 'ns')
+    to_end = dates <= np.datetime64(pd.Timestamp(period_end), 'ns')
+    return before, to_end
+
+
+def _last_balance(df, mask, default):
+    """Balance on the last row (in file order) where mask holds, else default."""
+    rows = np.flatnonzero(mask)
+    return float(df['Balance'].to_numpy()[rows[-1]]) if rows.size else default
+
+
+def _to_cents(amounts):
+    """
+    Amounts as int64 cents for matching. Each amount goes through round(x, 2)
+    first, so two amounts share a cent value exactly when they round equal.
+    """
+    rounded = np.array([round(amt, 2) for amt in amounts.tolist()], dtype=float)
+    return np.rint(rounded * 100).astype(np.int64)
+
+
 def load_cash_ledger(data_dir, period_start, period_end):
     """
     Load cash_ledger.xlsx, extract opening balance, and filter period rows.
     Cash ledger perspective: Debit = money IN, Credit = money OUT.
     """
     path = Path(data_dir) / 'cash_ledger.xlsx'
-    result = read_xlsx(
-        path,
+    result = cached_read(
+        'cash_ledger', read_xlsx, path,
         required_columns=['Date', 'Reference', 'Description', 'Debit', 'Credit', 'Balance'],
         optional_columns=['Bank Account']
     )
@@ -90,23 +128,20 @@ def load_cash_ledger(data_dir, period_start, period_end):
     df['Balance'] = pd.to_numeric(df['Balance'], errors='coerce')
     df['Reference'] = df['Reference'].astype(str).str.strip()
 
+    before, to_end = _period_masks(df, period_start, period_end)
+
     # Opening balance: last row before period_start
-    pre_period = df[df['Date'] < pd.Timestamp(period_start)]
-    if pre_period.empty:
-        opening_balance = 0.0
-    else:
-        opening_balance = float(pre_period.iloc[-1]['Balance'])
+    opening_balance = _last_balance(df, before, 0.0)
 
     # Period rows only
-    period_df = filter_by_period(df, 'Date', period_start, period_end)
-    period_df = period_df[period_df['Reference'] != 'OB'].copy()
+    period_df = df[~before & to_end & (df['Reference'] != 'OB').to_numpy()].copy()
 
     # Closing balance: last row in/before period end
-    at_end = df[df['Date'] <= pd.Timestamp(period_end)]
-    closing_balance = float(at_end.iloc[-1]['Balance']) if not at_end.empty else opening_balance
+    closing_balance = _last_balance(df, to_end, opening_balance)
 
     # Normalize: _amount > 0 = money in, < 0 = money out
     period_df['_amount'] = period_df['Debit'] - period_df['Credit']
+    period_df['_cents'] = _to_cents(period_df['_amount'])
     period_df = period_df.reset_index(drop=True)
 
     return period_df, opening_balance, closing_balance, None
@@ -118,8 +153,8 @@ def load_bank_statement(data_dir, period_start, period_end):
     Bank statement perspective: Debit = withdrawal (OUT), Credit = deposit (IN).
     """
     path = Path(data_dir) / 'bank_statement.xlsx'
-    result = read_xlsx(
-        path,
+    result = cached_read(
+        'bank_statement', read_xlsx, path,
         required_columns=['Date', 'Reference', 'Description', 'Balance'],
         optional_columns=['Debit', 'Credit']
     )
@@ -133,23 +168,20 @@ def load_bank_statement(data_dir, period_start, period_end):
     df['Balance'] = pd.to_numeric(df['Balance'], errors='coerce')
     df['Reference'] = df['Reference'].astype(str).str.strip()
 
+    before, to_end = _period_masks(df, period_start, period_end)
+
     # Opening balance: last row before period
-    pre_period = df[df['Date'] < pd.Timestamp(period_start)]
-    if pre_period.empty:
-        opening_balance = 0.0
-    else:
-        opening_balance = float(pre_period.iloc[-1]['Balance'])
+    opening_balance = _last_balance(df, before, 0.0)
 
     # Period rows
-    period_df = filter_by_period(df, 'Date', period_start, period_end)
-    period_df = period_df[period_df['Reference'] != 'OB'].copy()
+    period_df = df[~before & to_end & (df['Reference'] != 'OB').to_numpy()].copy()
 
     # Closing balance
-    at_end = df[df['Date'] <= pd.Timestamp(period_end)]
-    closing_balance = float(at_end.iloc[-1]['Balance']) if not at_end.empty else opening_balance
+    closing_balance = _last_balance(df, to_end, opening_balance)
 
     # Normalize: _amount > 0 = money in (deposit), < 0 = money out (withdrawal)
     period_df['_amount'] = period_df['Credit'] - period_df['Debit']
+    period_df['_cents'] = _to_cents(period_df['_amount'])
     period_df = period_df.reset_index(drop=True)
 
     return period_df, opening_balance, closing_balance, None
@@ -159,11 +191,35 @@ def load_bank_statement(data_dir, period_start, period_end):
 # 2. MATCHING
 # ─────────────────────────────────────────────────────────────────────────────
 
+# Columns of one side of the match as plain per-row lists
+MatchColumns = namedtuple('MatchColumns', 'ids refs cents stamps')
+
+_DAY_NS = 86_400 * 10**9
+
+
+def _match_columns(df):
+    """
+    Index labels, upper-cased references, integer cents and dates of df.
+    Dates are int nanoseconds since the epoch (None for NaT), so Pass 2
+    compares them with integer arithmetic.
+    """
+    dates = df['Date'].to_numpy(dtype='datetime64[ns]')
+    stamps = [None if nat else ns for nat, ns in
+              zip(np.isnat(dates).tolist(), dates.view(np.int64).tolist())]
+    return MatchColumns(
+        df.index.tolist(),
+        df['Reference'].str.upper().tolist(),
+        df['_cents'].tolist(),
+        stamps,
+    )
+
+
 def match_transactions(book_df, bank_df):
     """
     Match book (cash ledger) rows against bank statement rows.
 
-    Both sides have been normalized so _amount > 0 = money in, < 0 = money out.
+    Both sides have been normalized so _amount > 0 = money in, < 0 = money out,
+    with _cents holding the amount in whole cents for matching.
 
     Matching passes (in priority order):
       Pass 1 — Exact:    same Reference AND same _amount
@@ -174,52 +230,69 @@ def match_transactions(book_df, bank_df):
         book_only:  DataFrame of unmatched book rows
         bank_only:  DataFrame of unmatched bank rows
     """
-    book_matched = set()
-    bank_matched = set()
     matched_pairs = []
 
-    book_refs = book_df['Reference'].str.upper()
-    bank_refs = bank_df['Reference'].str.upper()
-
-    # Pass 1: Exact reference + exact amount
-    for bi in book_df.index:
-        b_ref = book_refs[bi]
-        b_amt = round(book_df.at[bi, '_amount'], 2)
-        for si in bank_df.index:
-            if si in bank_matched:
+    # Per-row keys, extracted once and shared by both passes
+    book = _match_columns(book_df)
+    bank = _match_columns(bank_df)
+
+    # Matched flags by row position; viewed as boolean masks at the end
+    book_matched = bytearray(len(book.ids))
+    bank_matched = bytearray(len(bank.ids))
+    book_left = len(book.ids)
+    bank_left = len(bank.ids)
+
+    # Pass 1: Exact reference + exact amount. Bank rows are indexed by
+    # (reference, amount) in statement order; each book row takes the
+    # earliest bank row with its key that is still unmatched.
+    bank_by_key = defaultdict(deque)
+    for sp, (s_ref, s_cents) in enumerate(zip(bank.refs, bank.cents)):
+        if isinstance(s_ref, str):   # a blank reference never matches
+            bank_by_key[(s_ref, s_cents)].append(sp)
+
+    for bp, (b_ref, b_cents) in enumerate(zip(book.refs, book.cents)):
+        candidates = bank_by_key.get((b_ref, b_cents))
+        if candidates:
+            sp = candidates.popleft()
+            matched_pairs.append({'book_idx': book.ids[bp], 'bank_idx': bank.ids[sp],
+                                  'match_type': 'Exact'})
+            book_matched[bp] = bank_matched[sp] = 1
+            book_left -= 1
+            bank_left -= 1
+
+    # Pass 2: Same amount + date within ±DATE_PROXIMITY_DAYS. Unmatched bank
+    # rows are grouped by amount in statement order; each book row only scans
+    # the rows with its amount, taking the first one close enough in date.
+    # Skipped outright when Pass 1 has already used up either side.
+    if book_left and bank_left:
+        bank_by_amount = defaultdict(list)
+        unmatched_bank = 0
+        # Rows without a date never match on date proximity.
+        for sp, (s_cents, s_ns) in enumerate(zip(bank.cents, bank.stamps)):
+            if not bank_matched[sp] and s_ns is not None:
+                bank_by_amount[s_cents].append((sp, s_ns))
+                unmatched_bank += 1
+
+        for bp, (b_cents, b_ns) in enumerate(zip(book.cents, book.stamps)):
+            if not unmatched_bank:
+                break   # every dated bank row is taken
+            if book_matched[bp] or b_ns is None:
                 continue
-            s_ref = bank_refs[si]
-            s_amt = round(bank_df.at[si, '_amount'], 2)
-            if b_ref == s_ref and b_amt == s_amt:
-                matched_pairs.append({'book_idx': bi, 'bank_idx': si, 'match_type': 'Exact'})
-                book_matched.add(bi)
-                bank_matched.add(si)
-                break
-
-    # Pass 2: Same amount + date within ±DATE_PROXIMITY_DAYS
-    for bi in book_df.index:
-        if bi in book_matched:
-            continue
-        b_amt = round(book_df.at[bi, '_amount'], 2)
-        b_date = book_df.at[bi, 'Date']
-        for si in bank_df.index:
-            if si in bank_matched:
+            candidates = bank_by_amount.get(b_cents)
+            if not candidates:
                 continue
-            s_amt = round(bank_df.at[si, '_amount'], 2)
-            s_date = bank_df.at[si, 'Date']
-            if b_amt == s_amt:
-                try:
-                    days_diff = abs((b_date - s_date).days)
-                except Exception:
-                    days_diff = 9999
-                if days_diff <= DATE_PROXIMITY_DAYS:
-                    matched_pairs.append({'book_idx': bi, 'bank_idx': si, 'match_type': 'Probable'})
-                    book_matched.add(bi)
-                    bank_matched.add(si)
+            for pos, (sp, s_ns) in enumerate(candidates):
+                # Whole days apart, floored like Timedelta.days
+                if abs((b_ns - s_ns) // _DAY_NS) <= DATE_PROXIMITY_DAYS:
+                    matched_pairs.append({'book_idx': book.ids[bp], 'bank_idx': bank.ids[sp],
+                                          'match_type': 'Probable'})
+                    book_matched[bp] = bank_matched[sp] = 1
+                    del candidates[pos]
+                    unmatched_bank -= 1
                     break
 
-    book_only = book_df[~book_df.index.isin(book_matched)].copy()
-    bank_only = bank_df[~bank_df.index.isin(bank_matched)].copy()
+    book_only = book_df[~np.frombuffer(book_matched, dtype=bool)].copy()
+    bank_only = bank_df[~np.frombuffer(bank_matched, dtype=bool)].copy()
 
     return matched_pairs, book_only, bank_only
 
@@ -250,6 +323,55 @@ def classify_bank_only(bank_only_df):
 # 3. ADJUSTING ENTRIES
 # ─────────────────────────────────────────────────────────────────────────────
 
+# Bank-only item rules, checked in order against the lower-cased description:
+# (keywords, category, dr_account, dr_code, cr_account, cr_code). The last
+# rule of each side has no keywords and catches everything else.
+BANK_CREDIT_RULES = [
+    (('interest',),
+     'Bank Interest Earned',
+     'Cash at Bank', BANK_ACCOUNT_CODE, 'Interest Income', INTEREST_INCOME_CODE),
+    (('payment', 'collection', 'transfer in'),
+     'Direct Credit — Accounts Receivable',
+     'Cash at Bank', BANK_ACCOUNT_CODE, 'Accounts Receivable', AR_CODE),
+    ((),
+     'Bank Credit — Investigate',
+     'Cash at Bank', BANK_ACCOUNT_CODE, 'Other Income', OTHER_INCOME_CODE),
+]
+BANK_DEBIT_RULES = [
+    (('charge', 'fee', 'service'),
+     'Bank Charges & Fees',
+     'Bank Charges & Fees', BANK_CHARGES_CODE, 'Cash at Bank', BANK_ACCOUNT_CODE),
+    (('insurance',),
+     'Insurance — Auto Debit',
+     'Insurance Expense', INSURANCE_CODE, 'Cash at Bank', BANK_ACCOUNT_CODE),
+    (('subscription', 'software', 'saas'),
+     'Software / Subscription',
+     'Telephone & Internet', COMMS_CODE, 'Cash at Bank', BANK_ACCOUNT_CODE),
+    (('loan', 'repayment', 'instalment'),
+     'Loan Repayment',
+     'Long-term Loans', LOAN_CODE, 'Cash at Bank', BANK_ACCOUNT_CODE),
+    (('dishonour', 'nsf', 'returned', 'bounce'),
+     'Dishonoured Cheque',
+     'Accounts Receivable', AR_CODE, 'Cash at Bank', BANK_ACCOUNT_CODE),
+    ((),
+     'Direct Debit — Investigate',
+     'Non-Operating Expense', MISC_EXPENSE_CODE, 'Cash at Bank', BANK_ACCOUNT_CODE),
+]
+_BANK_RULES = BANK_CREDIT_RULES + BANK_DEBIT_RULES
+_RULE_FIELDS = ('category', 'dr_account', 'dr_code', 'cr_account', 'cr_code')
+# One compiled alternation per keyword rule (None for the catch-alls)
+_RULE_PATTERNS = [re.compile('|'.join(re.escape(keyword) for keyword in rule[0]))
+                  if rule[0] else None for rule in _BANK_RULES]
+
+
+def _entry_from_rule(rule, abs_amt):
+    """Suggested entry dict for a rule; both sides carry abs_amt."""
+    entry = dict(zip(_RULE_FIELDS, rule[1:]))
+    entry['dr_amount'] = abs_amt
+    entry['cr_amount'] = abs_amt
+    return entry
+
+
 def categorize_bank_item(description, amount):
     """
     Suggest a journal entry for a bank-only item.
@@ -259,74 +381,49 @@ def categorize_bank_item(description, amount):
     Returns dict: category, dr_account, cr_account, dr_code, cr_code
     """
     desc = str(description).lower()
-    abs_amt = abs(amount)
-
-    if amount > 0:
-        # Bank credited the account — record as income/receipt in book
-        if 'interest' in desc:
-            return {'category': 'Bank Interest Earned',
-                    'dr_account': 'Cash at Bank', 'dr_code': BANK_ACCOUNT_CODE,
-                    'cr_account': 'Interest Income', 'cr_code': INTEREST_INCOME_CODE,
-                    'dr_amount': abs_amt, 'cr_amount': abs_amt}
-        elif 'payment' in desc or 'collection' in desc or 'transfer in' in desc:
-            return {'category': 'Direct Credit — Accounts Receivable',
-                    'dr_account': 'Cash at Bank', 'dr_code': BANK_ACCOUNT_CODE,
-                    'cr_account': 'Accounts Receivable', 'cr_code': AR_CODE,
-                    'dr_amount': abs_amt, 'cr_amount': abs_amt}
-        else:
-            return {'category': 'Bank Credit — Investigate',
-                    'dr_account': 'Cash at Bank', 'dr_code': BANK_ACCOUNT_CODE,
-                    'cr_account': 'Other Income', 'cr_code': OTHER_INCOME_CODE,
-                    'dr_amount': abs_amt, 'cr_amount': abs_amt}
-    else:
-        # Bank debited the account — record as expense/payment in book
-        if 'charge' in desc or 'fee' in desc or 'service' in desc:
-            return {'category': 'Bank Charges & Fees',
-                    'dr_account': 'Bank Charges & Fees', 'dr_code': BANK_CHARGES_CODE,
-                    'cr_account': 'Cash at Bank', 'cr_code': BANK_ACCOUNT_CODE,
-                    'dr_amount': abs_amt, 'cr_amount': abs_amt}
-        elif 'insurance' in desc:
-            return {'category': 'Insurance — Auto Debit',
-                    'dr_account': 'Insurance Expense', 'dr_code': INSURANCE_CODE,
-                    'cr_account': 'Cash at Bank', 'cr_code': BANK_ACCOUNT_CODE,
-                    'dr_amount': abs_amt, 'cr_amount': abs_amt}
-        elif 'subscription' in desc or 'software' in desc or 'saas' in desc:
-            return {'category': 'Software / Subscription',
-                    'dr_account': 'Telephone & Internet', 'dr_code': COMMS_CODE,
-                    'cr_account': 'Cash at Bank', 'cr_code': BANK_ACCOUNT_CODE,
-                    'dr_amount': abs_amt, 'cr_amount': abs_amt}
-        elif 'loan' in desc or 'repayment' in desc or 'instalment' in desc:
-            return {'category': 'Loan Repayment',
-                    'dr_account': 'Long-term Loans', 'dr_code': LOAN_CODE,
-                    'cr_account': 'Cash at Bank', 'cr_code': BANK_ACCOUNT_CODE,
-                    'dr_amount': abs_amt, 'cr_amount': abs_amt}
-        elif 'dishonour' in desc or 'nsf' in desc or 'returned' in desc or 'bounce' in desc:
-            return {'category': 'Dishonoured Cheque',
-                    'dr_account': 'Accounts Receivable', 'dr_code': AR_CODE,
-                    'cr_account': 'Cash at Bank', 'cr_code': BANK_ACCOUNT_CODE,
-                    'dr_amount': abs_amt, 'cr_amount': abs_amt}
+    rules = BANK_CREDIT_RULES if amount > 0 else BANK_DEBIT_RULES
+    for rule in rules:
+        if not rule[0] or any(keyword in desc for keyword in rule[0]):
+            return _entry_from_rule(rule, abs(amount))
+
+
+def classify_bank_items(df):
+    """
+    categorize_bank_item() for every row of a bank-only DataFrame at once.
+
+    Each keyword rule is one regex alternation over the lower-cased
+    descriptions; np.select keeps the first matching rule per row. Returns
+    the suggested entries as a list of dicts in row order.
+    """
+    if df.empty:
+        return []
+    desc = df['Description'].astype(str).fillna('nan').str.lower()
+    amounts = df['_amount'].to_numpy(dtype=float)
+    credit = amounts > 0
+
+    conditions = []
+    for i, pattern in enumerate(_RULE_PATTERNS):
+        side = credit if i < len(BANK_CREDIT_RULES) else ~credit
+        if pattern is None:
+            conditions.append(side)
         else:
-            return {'category': 'Direct Debit — Investigate',
-                    'dr_account': 'Non-Operating Expense', 'dr_code': MISC_EXPENSE_CODE,
-                    'cr_account': 'Cash at Bank', 'cr_code': BANK_ACCOUNT_CODE,
-                    'dr_amount': abs_amt, 'cr_amount': abs_amt}
+            conditions.append(side & desc.str.contains(pattern, na=False).to_numpy())
+    rule_idx = np.select(conditions, range(len(_BANK_RULES)))
+
+    return [_entry_from_rule(_BANK_RULES[i], abs_amt)
+            for i, abs_amt in zip(rule_idx.tolist(), np.abs(amounts).tolist())]
 
 
 def build_adjusting_entries(bank_credits, bank_debits, period_end):
     """Build list of required adjusting journal entries from bank-only items."""
     entries = []
-    for _, row in bank_credits.iterrows():
-        cat = categorize_bank_item(row['Description'], row['_amount'])
-        cat['date'] = row['Date']
-        cat['reference'] = row['Reference']
-        cat['description'] = row['Description']
-        entries.append(cat)
-    for _, row in bank_debits.iterrows():
-        cat = categorize_bank_item(row['Description'], row['_amount'])
-        cat['date'] = row['Date']
-        cat['reference'] = row['Reference']
-        cat['description'] = row['Description']
-        entries.append(cat)
+    for items in (bank_credits, bank_debits):
+        for cat, (date, reference, description, _) in zip(classify_bank_items(items),
+                                                          _item_rows(items)):
+            cat['date'] = date
+            cat['reference'] = reference
+            cat['description'] = description
+            entries.append(cat)
     return entries
 
 
@@ -350,15 +447,14 @@ def build_reconciliation(book_closing, bank_closing,
                       + Bank Credits not in Book (interest, direct credits)
                       - Bank Debits not in Book (charges, direct debits)
     """
-    total_deposits_in_transit = float(deposits_in_transit['_amount'].sum()) \
-        if not deposits_in_transit.empty else 0.0
-    total_outstanding_cheques = float(outstanding_cheques['_amount'].sum()) \
-        if not outstanding_cheques.empty else 0.0   # already negative
+    # fsum, like the totals on the detail sheets; an empty frame sums to 0.0
+    total_deposits_in_transit = math.fsum(deposits_in_transit['_amount'].to_numpy(dtype=float))
+    total_outstanding_cheques = math.fsum(
+        outstanding_cheques['_amount'].to_numpy(dtype=float))   # already negative
 
-    total_bank_credits = float(bank_credits['_amount'].sum()) \
-        if not bank_credits.empty else 0.0
-    total_bank_debits = float(bank_debits['_amount'].sum()) \
-        if not bank_debits.empty else 0.0       # already negative
+    total_bank_credits = math.fsum(bank_credits['_amount'].to_numpy(dtype=float))
+    total_bank_debits = math.fsum(
+        bank_debits['_amount'].to_numpy(dtype=float))           # already negative
 
     adjusted_bank = bank_closing + total_deposits_in_transit + total_outstanding_cheques
     adjusted_book = book_closing + total_bank_credits + total_bank_debits
@@ -384,6 +480,11 @@ def build_reconciliation(book_closing, bank_closing,
 # 5. EXCEL OUTPUT
 # ─────────────────────────────────────────────────────────────────────────────
 
+def _item_rows(df):
+    """(Date, Reference, Description, _amount) tuples for each row of df."""
+    return df[ITEM_COLUMNS].itertuples(index=False, name=None)
+
+
 def _fmt_date(val):
     """Format a date value as YYYY-MM-DD string."""
     if pd.isna(val) or val is None:
@@ -410,24 +511,23 @@ def write_dashboard(wb, recon, matched_count, period_start, period_end,
                       'Shwe Mandalay Cafe', period_str)
 
     def kv(label, value, row, number=False, is_status=False):
-        ws.cell(row=row, column=1, value=label).font = NORMAL_FONT
-        ws.cell(row=row, column=1).border = THIN_BORDER
+        label_cell = ws.cell(row=row, column=1, value=label)
+        label_cell.font = NORMAL_FONT
+        label_cell.border = THIN_BORDER
         cell = ws.cell(row=row, column=2, value=value)
         cell.border = THIN_BORDER
         if is_status:
             cell.fill = PASS_FILL if value == 'RECONCILED' else FAIL_FILL
-            cell.font = Font(bold=True, size=11, name='Arial',
-                             color='006100' if value == 'RECONCILED' else '9C0006')
-            cell.alignment = Alignment(horizontal='center')
+            cell.font = PASS_FONT if value == 'RECONCILED' else FAIL_FONT
+            cell.alignment = CENTER_ALIGN
         elif number:
             cell.number_format = NUMBER_FORMAT_NEG
-            cell.alignment = Alignment(horizontal='right')
-            cell.font = NORMAL_FONT
-            if isinstance(value, (int, float)) and value < 0:
-                cell.font = NEGATIVE_FONT
+            cell.alignment = RIGHT_ALIGN
+            negative = isinstance(value, (int, float)) and value < 0
+            cell.font = NEGATIVE_FONT if negative else NORMAL_FONT
         else:
             cell.font = NORMAL_FONT
-            cell.alignment = Alignment(horizontal='left')
+            cell.alignment = LEFT_ALIGN
         return row + 1
 
     # Status
@@ -470,6 +570,25 @@ def write_dashboard(wb, recon, matched_count, period_start, period_end,
     freeze_panes(ws, row=2, col=1)
 
 
+# Reconciliation statement, one entry per side:
+# (side label, balance label, recon key, blocks, adjusted label, recon key),
+# where each block is (section label, items frame, total label, recon key).
+RECONCILIATION_LAYOUT = [
+    ('BANK STATEMENT SIDE', 'Balance per Bank Statement', 'bank_closing', [
+        ('Add: Deposits in Transit (in book, not yet on bank statement)',
+         'deposits_in_transit', 'Total Deposits in Transit', 'total_deposits_in_transit'),
+        ('Less: Outstanding Cheques (in book, not yet cleared by bank)',
+         'outstanding_cheques', 'Total Outstanding Cheques', 'total_outstanding_cheques'),
+     ], 'ADJUSTED BANK BALANCE', 'adjusted_bank'),
+    ('CASH BOOK SIDE', 'Balance per Cash Book', 'book_closing', [
+        ('Add: Bank Credits not yet in Cash Book',
+         'bank_credits', 'Total Bank Credits not in Book', 'total_bank_credits'),
+        ('Less: Bank Debits not yet in Cash Book',
+         'bank_debits', 'Total Bank Debits not in Book', 'total_bank_debits'),
+     ], 'ADJUSTED CASH BOOK BALANCE', 'adjusted_book'),
+]
+
+
 def write_reconciliation_statement(wb, recon, deposits_in_transit,
                                    outstanding_cheques, bank_credits, bank_debits,
                                    period_end):
@@ -480,115 +599,77 @@ def write_reconciliation_statement(wb, recon, deposits_in_transit,
     def section(label, r):
         ws.merge_cells(start_row=r, start_column=1, end_row=r, end_column=4)
         c = ws.cell(row=r, column=1, value=label)
-        c.font = Font(bold=True, size=11, name='Arial', color='1F4E79')
-        c.fill = PatternFill('solid', fgColor='D6E4F0')
+        c.font = SECTION_FONT
+        c.fill = SECTION_FILL
         c.border = THIN_BORDER
         return r + 1
 
     def item(label, amt, r, indent=False, total=False, double=False):
-        from openpyxl.styles import Border, Side
+        # Every style below is a shared module-level object, and each cell
+        # gets its final font and border in a single assignment.
+        border = (DOUBLE_BOTTOM if double else BOTTOM_BORDER) if total else THIN_BORDER
         label_cell = ws.cell(row=r, column=1 if not indent else 2, value=label)
         label_cell.font = TOTAL_FONT if total else NORMAL_FONT
-        label_cell.border = THIN_BORDER
+        label_cell.border = THIN_BORDER if indent else border
         if indent:
             ws.cell(row=r, column=1).border = THIN_BORDER
+            ws.cell(row=r, column=3).border = THIN_BORDER
 
         amount_cell = ws.cell(row=r, column=4, value=_fmt_num(amt))
         amount_cell.number_format = NUMBER_FORMAT_NEG
-        amount_cell.alignment = Alignment(horizontal='right')
+        amount_cell.alignment = RIGHT_ALIGN
+        amount_cell.border = border
         if total:
             amount_cell.font = TOTAL_FONT
-            from openpyxl.styles import Border, Side
-            if double:
-                amount_cell.border = Border(bottom=Side(style='double'))
-                label_cell.border = Border(bottom=Side(style='double'))
-            else:
-                amount_cell.border = Border(bottom=Side(style='medium'))
-                label_cell.border = Border(bottom=Side(style='medium'))
+        elif isinstance(amt, (int, float)) and amt < 0:
+            amount_cell.font = NEGATIVE_FONT
         else:
             amount_cell.font = NORMAL_FONT
-            amount_cell.border = THIN_BORDER
-            if isinstance(amt, (int, float)) and amt < 0:
-                amount_cell.font = NEGATIVE_FONT
-
-        if indent:
-            for col in [2, 3]:
-                ws.cell(row=r, column=col).border = THIN_BORDER
 
         return r + 1
 
-    # ── BANK SIDE ─────────────────────────────────────────────────────────────
-    row = section('BANK STATEMENT SIDE', row)
-    row = item('Balance per Bank Statement', recon['bank_closing'], row)
-    row += 1
-
-    row = section('Add: Deposits in Transit (in book, not yet on bank statement)', row)
-    if not deposits_in_transit.empty:
-        for _, r_ in deposits_in_transit.iterrows():
-            row = item(f"  {_fmt_date(r_['Date'])}  {r_['Reference']}  "
-                       f"{r_['Description']}", r_['_amount'], row, indent=True)
-    row = item('Total Deposits in Transit', recon['total_deposits_in_transit'],
-               row, total=True)
-    row += 1
-
-    row = section('Less: Outstanding Cheques (in book, not yet cleared by bank)', row)
-    if not outstanding_cheques.empty:
-        for _, r_ in outstanding_cheques.iterrows():
-            row = item(f"  {_fmt_date(r_['Date'])}  {r_['Reference']}  "
-                       f"{r_['Description']}", r_['_amount'], row, indent=True)
-    row = item('Total Outstanding Cheques', recon['total_outstanding_cheques'],
-               row, total=True)
-    row += 1
-
-    row = item('ADJUSTED BANK BALANCE', recon['adjusted_bank'],
-               row, total=True, double=True)
-    row += 2
-
-    # ── BOOK SIDE ─────────────────────────────────────────────────────────────
-    row = section('CASH BOOK SIDE', row)
-    row = item('Balance per Cash Book', recon['book_closing'], row)
-    row += 1
-
-    row = section('Add: Bank Credits not yet in Cash Book', row)
-    if not bank_credits.empty:
-        for _, r_ in bank_credits.iterrows():
-            row = item(f"  {_fmt_date(r_['Date'])}  {r_['Reference']}  "
-                       f"{r_['Description']}", r_['_amount'], row, indent=True)
-    row = item('Total Bank Credits not in Book', recon['total_bank_credits'],
-               row, total=True)
-    row += 1
-
-    row = section('Less: Bank Debits not yet in Cash Book', row)
-    if not bank_debits.empty:
-        for _, r_ in bank_debits.iterrows():
-            row = item(f"  {_fmt_date(r_['Date'])}  {r_['Reference']}  "
-                       f"{r_['Description']}", r_['_amount'], row, indent=True)
-    row = item('Total Bank Debits not in Book', recon['total_bank_debits'],
-               row, total=True)
-    row += 1
-
-    row = item('ADJUSTED CASH BOOK BALANCE', recon['adjusted_book'],
-               row, total=True, double=True)
-    row += 2
+    # Both sides follow RECONCILIATION_LAYOUT: balance, then each block of
+    # reconciling items with its total, then the adjusted balance.
+    item_frames = {
+        'deposits_in_transit': deposits_in_transit,
+        'outstanding_cheques': outstanding_cheques,
+        'bank_credits': bank_credits,
+        'bank_debits': bank_debits,
+    }
+    for side_label, balance_label, balance_key, blocks, adjusted_label, adjusted_key \
+            in RECONCILIATION_LAYOUT:
+        row = section(side_label, row)
+        row = item(balance_label, recon[balance_key], row)
+        row += 1
+
+        for block_label, frame_key, total_label, total_key in blocks:
+            row = section(block_label, row)
+            for date, reference, description, amount in _item_rows(item_frames[frame_key]):
+                row = item(f"  {_fmt_date(date)}  {reference}  {description}",
+                           amount, row, indent=True)
+            row = item(total_label, recon[total_key], row, total=True)
+            row += 1
+
+        row = item(adjusted_label, recon[adjusted_key], row, total=True, double=True)
+        row += 2
 
     # ── DIFFERENCE ────────────────────────────────────────────────────────────
     diff_row = row
     ws.cell(row=diff_row, column=1, value='Difference (must be ZERO)').font = TOTAL_FONT
     diff_cell = ws.cell(row=diff_row, column=4, value=recon['difference'])
     diff_cell.number_format = NUMBER_FORMAT_NEG
-    diff_cell.alignment = Alignment(horizontal='right')
+    diff_cell.alignment = RIGHT_ALIGN
     if recon['reconciled']:
         diff_cell.fill = PASS_FILL
-        diff_cell.font = Font(bold=True, size=11, name='Arial', color='006100')
+        diff_cell.font = PASS_FONT
     else:
         diff_cell.fill = FAIL_FILL
-        diff_cell.font = Font(bold=True, size=11, name='Arial', color='9C0006')
+        diff_cell.font = FAIL_FONT
     row += 2
 
     status_cell = ws.cell(row=row, column=1,
                           value='RECONCILED' if recon['reconciled'] else 'NOT RECONCILED')
-    status_cell.font = Font(bold=True, size=14, name='Arial',
-                            color='006100' if recon['reconciled'] else '9C0006')
+    status_cell.font = STATUS_PASS_FONT if recon['reconciled'] else STATUS_FAIL_FONT
 
     for col_letter in ['A', 'B', 'C', 'D']:
         ws.column_dimensions[col_letter].width = 50 if col_letter == 'A' else \
@@ -598,6 +679,8 @@ def write_reconciliation_statement(wb, recon, deposits_in_transit,
 
 def write_matched_items(wb, matched_pairs, book_df, bank_df):
     ws = add_sheet(wb, 'Matched Items', tab_color='4472C4')
+    stream_sheet(ws)
+    freeze_panes(ws)
     row = write_title(ws, 'Matched Transactions',
                       'Transactions successfully matched between cash book and bank statement')
     headers = ['Match Type', 'Book Date', 'Book Reference', 'Book Description',
@@ -605,105 +688,99 @@ def write_matched_items(wb, matched_pairs, book_df, bank_df):
                'Bank Amount']
     row = write_header_row(ws, headers, row)
 
-    for pair in matched_pairs:
-        bi = pair['book_idx']
-        si = pair['bank_idx']
-        brow = book_df.loc[bi]
-        srow = bank_df.loc[si]
-        values = [
-            pair['match_type'],
-            _fmt_date(brow['Date']),
-            brow['Reference'],
-            brow['Description'],
-            _fmt_num(brow['_amount']),
-            _fmt_date(srow['Date']),
-            srow['Reference'],
-            srow['Description'],
-            _fmt_num(srow['_amount']),
-        ]
-        row = write_data_row(ws, values, row, number_cols=[5, 9])
+    # Both sides of every pair in one lookup each, in pair order
+    book_rows = _item_rows(book_df.loc[[pair['book_idx'] for pair in matched_pairs]])
+    bank_rows = _item_rows(bank_df.loc[[pair['bank_idx'] for pair in matched_pairs]])
+    row = write_data_rows(ws, ([
+        pair['match_type'],
+        _fmt_date(b_date), b_ref, b_desc, _fmt_num(b_amt),
+        _fmt_date(s_date), s_ref, s_desc, _fmt_num(s_amt),
+    ] for pair, (b_date, b_ref, b_desc, b_amt), (s_date, s_ref, s_desc, s_amt)
+        in zip(matched_pairs, book_rows, bank_rows)), row, number_cols=[5, 9])
 
     auto_fit_columns(ws)
-    freeze_panes(ws)
 
 
 def write_outstanding_cheques(wb, outstanding_cheques):
     ws = add_sheet(wb, 'Outstanding Cheques', tab_color='4472C4')
+    stream_sheet(ws)
+    freeze_panes(ws)
     row = write_title(ws, 'Outstanding Cheques',
                       'Payments in cash book not yet cleared by bank')
     headers = ['Date', 'Reference', 'Description', 'Amount']
     row = write_header_row(ws, headers, row)
 
-    total = 0.0
-    for _, r_ in outstanding_cheques.iterrows():
-        amt = r_['_amount']
-        total += float(amt)
-        row = write_data_row(ws, [
-            _fmt_date(r_['Date']), r_['Reference'],
-            r_['Description'], _fmt_num(amt)
-        ], row, number_cols=[4])
+    row = write_data_rows(ws, ([
+        _fmt_date(date), reference, description, _fmt_num(amount)
+    ] for date, reference, description, amount in _item_rows(outstanding_cheques)), row, number_cols=[4])
+    total = math.fsum(outstanding_cheques['_amount'].to_numpy(dtype=float))
 
     row = write_total_row(ws, 'Total Outstanding Cheques', [_fmt_num(total)], row,
                          double_line=True)
     auto_fit_columns(ws)
-    freeze_panes(ws)
 
 
 def write_deposits_in_transit(wb, deposits_in_transit):
     ws = add_sheet(wb, 'Deposits in Transit', tab_color='4472C4')
+    stream_sheet(ws)
+    freeze_panes(ws)
     row = write_title(ws, 'Deposits in Transit',
                       'Receipts in cash book not yet credited by bank')
     headers = ['Date', 'Reference', 'Description', 'Amount']
     row = write_header_row(ws, headers, row)
 
-    total = 0.0
-    for _, r_ in deposits_in_transit.iterrows():
-        amt = r_['_amount']
-        total += float(amt)
-        row = write_data_row(ws, [
-            _fmt_date(r_['Date']), r_['Reference'],
-            r_['Description'], _fmt_num(amt)
-        ], row, number_cols=[4])
+    row = write_data_rows(ws, ([
+        _fmt_date(date), reference, description, _fmt_num(amount)
+    ] for date, reference, description, amount in _item_rows(deposits_in_transit)), row, number_cols=[4])
+    total = math.fsum(deposits_in_transit['_amount'].to_numpy(dtype=float))
 
     row = write_total_row(ws, 'Total Deposits in Transit', [_fmt_num(total)], row,
                          double_line=True)
     auto_fit_columns(ws)
-    freeze_panes(ws)
 
 
-def write_bank_only_items(wb, bank_credits, bank_debits):
+def write_bank_only_items(wb, bank_credits, bank_debits, adjusting_entries):
+    """
+    adjusting_entries is build_adjusting_entries() output for the same items
+    (credits first, then debits, one entry per row), so the Type and Action
+    columns reuse its classification instead of classifying the items again.
+    """
     ws = add_sheet(wb, 'Bank-Only Items', tab_color='70AD47')
+    stream_sheet(ws)
+    freeze_panes(ws)
     row = write_title(ws, 'Bank-Only Items',
                       'Items on bank statement not found in cash book — require adjusting entries')
     headers = ['Date', 'Reference', 'Description', 'Type', 'Amount', 'Action Required']
     row = write_header_row(ws, headers, row)
 
+    credit_entries = adjusting_entries[:len(bank_credits)]
+    debit_entries = adjusting_entries[len(bank_credits):]
+
     if not bank_credits.empty:
         row = write_section_header(ws, 'BANK CREDITS (deposits not in cash book)', row, col_span=6)
-        for _, r_ in bank_credits.iterrows():
-            cat = categorize_bank_item(r_['Description'], r_['_amount'])
-            row = write_data_row(ws, [
-                _fmt_date(r_['Date']), r_['Reference'], r_['Description'],
-                cat['category'], _fmt_num(r_['_amount']),
-                f"Dr {cat['dr_account']} / Cr {cat['cr_account']}"
-            ], row, number_cols=[5])
+        row = write_data_rows(ws, ([
+            _fmt_date(date), reference, description,
+            cat['category'], _fmt_num(amount),
+            f"Dr {cat['dr_account']} / Cr {cat['cr_account']}"
+        ] for cat, (date, reference, description, amount)
+            in zip(credit_entries, _item_rows(bank_credits))), row, number_cols=[5])
 
     if not bank_debits.empty:
         row = write_section_header(ws, 'BANK DEBITS (withdrawals not in cash book)', row, col_span=6)
-        for _, r_ in bank_debits.iterrows():
-            cat = categorize_bank_item(r_['Description'], r_['_amount'])
-            row = write_data_row(ws, [
-                _fmt_date(r_['Date']), r_['Reference'], r_['Description'],
-                cat['category'], _fmt_num(r_['_amount']),
-                f"Dr {cat['dr_account']} / Cr {cat['cr_account']}"
-            ], row, number_cols=[5])
+        row = write_data_rows(ws, ([
+            _fmt_date(date), reference, description,
+            cat['category'], _fmt_num(amount),
+            f"Dr {cat['dr_account']} / Cr {cat['cr_account']}"
+        ] for cat, (date, reference, description, amount)
+            in zip(debit_entries, _item_rows(bank_debits))), row, number_cols=[5])
 
     auto_fit_columns(ws)
-    freeze_panes(ws)
 
 
 def write_adjusting_entries(wb, adjusting_entries):
     ws = add_sheet(wb, 'Adjusting Entries', tab_color='4472C4')
+    stream_sheet(ws)
+    freeze_panes(ws)
     row = write_title(ws, 'Required Adjusting Entries',
                       'Journal entries to bring cash book in line with bank statement',
                       'Post these entries in Module 4 (Journal Adjustments)')
@@ -711,16 +788,16 @@ def write_adjusting_entries(wb, adjusting_entries):
                'Dr Account', 'Dr Code', 'Dr Amount', 'Cr Account', 'Cr Code', 'Cr Amount']
     row = write_header_row(ws, headers, row)
 
-    total_dr = 0.0
-    total_cr = 0.0
-    for e in adjusting_entries:
-        row = write_data_row(ws, [
-            _fmt_date(e['date']), e['reference'], e['description'], e['category'],
-            e['dr_account'], e['dr_code'], _fmt_num(e['dr_amount']),
-            e['cr_account'], e['cr_code'], _fmt_num(e['cr_amount']),
-        ], row, number_cols=[7, 10])
-        total_dr += e['dr_amount']
-        total_cr += e['cr_amount']
+    row = write_data_rows(ws, ([
+        _fmt_date(e['date']), e['reference'], e['description'], e['category'],
+        e['dr_account'], e['dr_code'], _fmt_num(e['dr_amount']),
+        e['cr_account'], e['cr_code'], _fmt_num(e['cr_amount']),
+    ] for e in adjusting_entries), row, number_cols=[7, 10])
+    count = len(adjusting_entries)
+    total_dr = math.fsum(np.fromiter((e['dr_amount'] for e in adjusting_entries),
+                                     dtype=np.float64, count=count))
+    total_cr = math.fsum(np.fromiter((e['cr_amount'] for e in adjusting_entries),
+                                     dtype=np.float64, count=count))
 
     row = write_total_row(ws, 'Totals', [None, None, None, None,
                                           _fmt_num(total_dr), None, None,
@@ -735,7 +812,6 @@ def write_adjusting_entries(wb, adjusting_entries):
     row += 1
 
     auto_fit_columns(ws)
-    freeze_panes(ws)
 
 
 def write_exceptions_sheet(wb, exceptions):
@@ -775,6 +851,8 @@ def main():
     exceptions = []
 
     # ── Load data ─────────────────────────────────────────────────────────────
+    # Loaded one after the other: parsing holds the GIL, so a thread pool does
+    # not overlap the two reads, and unchanged files come from the cache anyway.
     print("Loading cash ledger...")
     book_df, book_opening, book_closing, err = load_cash_ledger(ledgers_dir, period_start, period_end)
     if err:
@@ -811,25 +889,14 @@ def main():
     deposits_in_transit, outstanding_cheques = classify_book_only(book_only)
     bank_credits, bank_debits = classify_bank_only(bank_only)
 
-    print(f"\n  Deposits in Transit  : {len(deposits_in_transit)}")
-    for _, r_ in deposits_in_transit.iterrows():
-        print(f"    {_fmt_date(r_['Date'])}  {r_['Reference']:<12}  "
-              f"{r_['_amount']:>12,.0f}  {r_['Description']}")
-
-    print(f"\n  Outstanding Cheques  : {len(outstanding_cheques)}")
-    for _, r_ in outstanding_cheques.iterrows():
-        print(f"    {_fmt_date(r_['Date'])}  {r_['Reference']:<12}  "
-              f"{r_['_amount']:>12,.0f}  {r_['Description']}")
-
-    print(f"\n  Bank Credits not in Book : {len(bank_credits)}")
-    for _, r_ in bank_credits.iterrows():
-        print(f"    {_fmt_date(r_['Date'])}  {r_['Reference']:<12}  "
-              f"{r_['_amount']:>12,.0f}  {r_['Description']}")
-
-    print(f"\n  Bank Debits not in Book  : {len(bank_debits)}")
-    for _, r_ in bank_debits.iterrows():
-        print(f"    {_fmt_date(r_['Date'])}  {r_['Reference']:<12}  "
-              f"{r_['_amount']:>12,.0f}  {r_['Description']}")
+    for heading, items in (('Deposits in Transit  ', deposits_in_transit),
+                           ('Outstanding Cheques  ', outstanding_cheques),
+                           ('Bank Credits not in Book ', bank_credits),
+                           ('Bank Debits not in Book  ', bank_debits)):
+        print(f"\n  {heading}: {len(items)}")
+        for date, reference, description, amount in _item_rows(items):
+            print(f"    {_fmt_date(date)}  {reference:<12}  "
+                  f"{amount:>12,.0f}  {description}")
 
     # ── Reconciliation calculation ────────────────────────────────────────────
     recon = build_reconciliation(book_closing, bank_closing,
@@ -866,7 +933,8 @@ def main():
     print(f"\nWriting output to: {output_file}")
     Path(output_file).parent.mkdir(parents=True, exist_ok=True)
 
-    wb = create_workbook()
+    # Streamed sheets are serialized with lxml when it is installed (optional)
+    wb = create_workbook(write_only=True)
     write_dashboard(wb, recon, len(matched_pairs), period_start, period_end,
                     deposits_in_transit, outstanding_cheques,
                     bank_credits, bank_debits, exceptions)
@@ -875,7 +943,7 @@ def main():
     write_matched_items(wb, matched_pairs, book_df, bank_df)
     write_outstanding_cheques(wb, outstanding_cheques)
     write_deposits_in_transit(wb, deposits_in_transit)
-    write_bank_only_items(wb, bank_credits, bank_debits)
+    write_bank_only_items(wb, bank_credits, bank_debits, adjusting_entries)
     write_adjusting_entries(wb, adjusting_entries)
     if exceptions:
         write_exceptions_sheet(wb, exceptions)
@@ -10,14 +10,16 @@ Example:
 """
 import sys
 import os
+import numpy as np
 import pandas as pd
 from pathlib import Path
 
 sys.path.insert(0, os.path.dirname(__file__))
 from utils.excel_reader import read_xlsx, filter_by_period
 from utils.excel_writer import (create_workbook, add_sheet, write_title, write_header_row,
-                                 write_data_row, write_section_header, write_total_row,
+                                 write_data_row, write_data_rows, write_section_header, write_total_row,
                                  auto_fit_columns, freeze_panes, save_workbook, TOTAL_FONT,
+                                 NEGATIVE_FONT, TOTAL_NEGATIVE_FONT, NUMBER_FORMAT_NEG, RIGHT_ALIGN,
                                  PASS_FILL, FAIL_FILL, write_validation_result)
 from utils.double_entry import validate_journal_balance
 from utils.coa_mapper import COAMapper
@@ -66,51 +68,72 @@ JOURNAL_CONFIGS = {
 }
 
 
-def find_journal_file(input_dir, patterns):
-    """Find a journal file in the input directory."""
-    input_dir = Path(input_dir)
-    for f in input_dir.glob('*.xlsx'):
-        fname = f.stem.lower().replace('-', '_').replace(' ', '_')
+def scan_journal_files(input_dir):
+    """(normalized stem, path) for every .xlsx in input_dir, in glob order."""
+    return [(f.stem.lower().replace('-', '_').replace(' ', '_'), f)
+            for f in Path(input_dir).glob('*.xlsx')]
+
+
+def find_journal_file(input_dir, patterns, files=None):
+    """
+    Find a journal file in the input directory. files is an optional
+    scan_journal_files() result, so the directory is listed once for all
+    journals.
+    """
+    if files is None:
+        files = scan_journal_files(input_dir)
+    patterns = [pattern.replace(' ', '_') for pattern in patterns]
+    for fname, f in files:
         for pattern in patterns:
-            if pattern.replace(' ', '_') in fname:
+            if pattern in fname:
                 return f
     return None
 
 
 def get_amounts(df):
-    """Extract debit and credit amounts from a journal DataFrame."""
+    """
+    Debit and credit amounts of a journal DataFrame, as a pair of arrays in
+    row order. df itself is left unchanged.
+    """
     if 'Debit Amount' in df.columns and 'Credit Amount' in df.columns:
-        df['_debit'] = pd.to_numeric(df['Debit Amount'], errors='coerce').fillna(0)
-        df['_credit'] = pd.to_numeric(df['Credit Amount'], errors='coerce').fillna(0)
+        debit = pd.to_numeric(df['Debit Amount'], errors='coerce').fillna(0).to_numpy()
+        credit = pd.to_numeric(df['Credit Amount'], errors='coerce').fillna(0).to_numpy()
     elif 'Amount' in df.columns:
-        df['_debit'] = pd.to_numeric(df['Amount'], errors='coerce').fillna(0)
-        df['_credit'] = pd.to_numeric(df['Amount'], errors='coerce').fillna(0)
+        # Single-amount journals post the same figure on both sides
+        debit = pd.to_numeric(df['Amount'], errors='coerce').fillna(0).to_numpy()
+        credit = debit
     else:
-        df['_debit'] = 0
-        df['_credit'] = 0
-    return df
+        debit = credit = np.zeros(len(df), dtype=np.int64)
+    return debit, credit
 
 
 def summarize_single_journal(df, journal_name):
-    """Summarize a single journal's transactions by account."""
-    df = get_amounts(df)
-    
-    # Summarize by debit account
-    debit_summary = df.groupby('Debit Account').agg(
-        debit_total=('_debit', 'sum'),
-        debit_count=('_debit', 'count')
-    ).reset_index()
-    debit_summary.rename(columns={'Debit Account': 'Account Code'}, inplace=True)
-    
-    # Summarize by credit account
-    credit_summary = df.groupby('Credit Account').agg(
-        credit_total=('_credit', 'sum'),
-        credit_count=('_credit', 'count')
-    ).reset_index()
-    credit_summary.rename(columns={'Credit Account': 'Account Code'}, inplace=True)
-    
-    # Merge
-    summary = pd.merge(debit_summary, credit_summary, on='Account Code', how='outer').fillna(0)
+    """
+    Summarize a single journal's transactions by account. Uses df's _debit /
+    _credit columns when present, otherwise derives them with get_amounts().
+    """
+    if '_debit' not in df.columns:
+        debit, credit = get_amounts(df)
+        df = df.assign(_debit=debit, _credit=credit)
+
+    # Debit and credit postings stacked into one long table, so a single
+    # groupby yields both sides' totals and counts per account
+    n = len(df)
+    postings = pd.DataFrame({
+        'code': np.concatenate([df['Debit Account'].to_numpy(), df['Credit Account'].to_numpy()]),
+        'side': np.repeat(['debit', 'credit'], n),
+        'amount': np.concatenate([df['_debit'].to_numpy(), df['_credit'].to_numpy()]),
+    })
+    grouped = (postings.groupby(['code', 'side'])['amount'].agg(['sum', 'count'])
+               .unstack('side')
+               .reindex(columns=pd.MultiIndex.from_product([['sum', 'count'], ['debit', 'credit']])))
+    summary = pd.DataFrame({
+        'Account Code': grouped.index,
+        'debit_total': grouped[('sum', 'debit')].to_numpy(),
+        'debit_count': grouped[('count', 'debit')].to_numpy(),
+        'credit_total': grouped[('sum', 'credit')].to_numpy(),
+        'credit_count': grouped[('count', 'credit')].to_numpy(),
+    }).fillna(0)
     summary['Account Code'] = summary['Account Code'].astype(int)
     summary = summary.sort_values('Account Code')
     
@@ -125,7 +148,6 @@ def summarize_single_journal(df, journal_name):
 
 def write_pc_summary_sheet(wb, pc_summary, cc_summary, period_start, period_end, pcc=None):
     """Write the Profit Center P&L summary sheet."""
-    from openpyxl.styles import PatternFill, Font
     ws = add_sheet(wb, 'PC Summary', tab_color='70AD47')
     row = write_title(ws, 'Profit Center Summary — P&L View', period=f"{period_start} to {period_end}")
 
@@ -141,16 +163,15 @@ def write_pc_summary_sheet(wb, pc_summary, cc_summary, period_start, period_end,
         ws.cell(row=row, column=1, value=prefix + label)
         total = sum(v for v in values if isinstance(v, (int, float)))
         all_vals = values + [total]
+        negative_font = TOTAL_NEGATIVE_FONT if is_total else NEGATIVE_FONT
         for col_i, val in enumerate(all_vals, 2):
             cell = ws.cell(row=row, column=col_i, value=val)
-            cell.number_format = '#,##0;(#,##0);"-"'
-            from openpyxl.styles import Alignment
-            cell.alignment = Alignment(horizontal='right')
-            if is_total:
-                cell.font = TOTAL_FONT
+            cell.number_format = NUMBER_FORMAT_NEG
+            cell.alignment = RIGHT_ALIGN
             if isinstance(val, (int, float)) and val < 0:
-                from openpyxl.styles import Font as F
-                cell.font = F(bold=is_total, color='FF0000', size=11, name='Arial')
+                cell.font = negative_font
+            elif is_total:
+                cell.font = TOTAL_FONT
         if is_total:
             ws.cell(row=row, column=1).font = TOTAL_FONT
         return row + 1
@@ -228,7 +249,7 @@ def write_cc_summary_sheet(wb, cc_summary, period_start, period_end, pcc=None):
 
 def main(journals_dir, period_start, period_end, output_file, master_dir=None):
     journals_dir = Path(journals_dir)
-    wb = create_workbook()
+    wb = create_workbook(write_only=True)
 
     # Load master files from master_dir
     coa_file = None
@@ -246,25 +267,26 @@ def main(journals_dir, period_start, period_end, output_file, master_dir=None):
     all_summaries = []
     journal_results = {}
     journal_dfs = {}        # raw filtered DataFrames — used for PC/CC analysis
-    exceptions = []
+    exceptions = []         # (journal, issue, details) rows of the Exceptions sheet
 
     # ── Process each journal ─────────────────────────────────────────────────
+    journal_files = scan_journal_files(journals_dir)
     for journal_name, config in JOURNAL_CONFIGS.items():
-        filepath = find_journal_file(journals_dir, config['filename_patterns'])
+        filepath = find_journal_file(journals_dir, config['filename_patterns'], journal_files)
         if filepath is None:
-            exceptions.append({'Journal': journal_name, 'Issue': 'File not found', 'Details': f"No file matching {config['filename_patterns']}"})
+            exceptions.append((journal_name, 'File not found', f"No file matching {config['filename_patterns']}"))
             continue
 
         result = read_xlsx(filepath, required_columns=config['required'], optional_columns=config['optional'], date_columns=['Date'])
         if result['error']:
-            exceptions.append({'Journal': journal_name, 'Issue': 'Read error', 'Details': result['error']})
+            exceptions.append((journal_name, 'Read error', result['error']))
             continue
 
         df = result['data']
         df = filter_by_period(df, 'Date', period_start, period_end)
 
         if len(df) == 0:
-            exceptions.append({'Journal': journal_name, 'Issue': 'No data in period', 'Details': f"No transactions between {period_start} and {period_end}"})
+            exceptions.append((journal_name, 'No data in period', f"No transactions between {period_start} and {period_end}"))
             continue
 
         # Validate double-entry balance
@@ -275,16 +297,18 @@ def main(journals_dir, period_start, period_end, output_file, master_dir=None):
 
         if not balance_check['balanced']:
             for ub in balance_check['unbalanced_entries']:
-                exceptions.append({'Journal': journal_name, 'Issue': 'Unbalanced entry', 'Details': str(ub)})
+                exceptions.append((journal_name, 'Unbalanced entry', str(ub)))
 
         # Validate PC/CC codes
-        pcc_issues = pcc.validate_journal_rows(df, journal_name)
-        for issue in pcc_issues:
-            exceptions.append({'Journal': issue['journal'], 'Issue': f"Row {issue['row']}", 'Details': issue['issue']})
+        exceptions.extend((issue['journal'], f"Row {issue['row']}", issue['issue'])
+                          for issue in pcc.validate_journal_rows(df, journal_name))
 
+        # Amounts are parsed once; the summary and the PC/CC analysis share them
+        debit, credit = get_amounts(df)
+        df = df.assign(_debit=debit, _credit=credit)
         summary = summarize_single_journal(df, journal_name)
         journal_results[journal_name] = summary
-        journal_dfs[journal_name] = get_amounts(df.copy())
+        journal_dfs[journal_name] = df
         all_summaries.append(summary)
 
         # Write journal detail sheet
@@ -293,11 +317,10 @@ def main(journals_dir, period_start, period_end, output_file, master_dir=None):
         row = write_title(ws, journal_name, period=f"{period_start} to {period_end}")
         row = write_header_row(ws, ['Account Code', 'Debit Total', 'Debit Count', 'Credit Total', 'Credit Count'], row)
 
-        for _, r in summary['summary'].iterrows():
-            row = write_data_row(ws, [
-                int(r['Account Code']), r['debit_total'], int(r['debit_count']),
-                r['credit_total'], int(r['credit_count'])
-            ], row)
+        row = write_data_rows(ws, ([
+            int(code), debit_total, int(debit_count), credit_total, int(credit_count)
+        ] for code, debit_total, debit_count, credit_total, credit_count
+            in summary['summary'].itertuples(index=False, name=None)), row)
 
         row += 1
         row = write_total_row(ws, 'TOTALS', [summary['total_debits'], summary['transaction_count'],
@@ -347,21 +370,18 @@ def main(journals_dir, period_start, period_end, output_file, master_dir=None):
     row = write_section_header(ws_dash, 'CONSOLIDATED ACCOUNT SUMMARY', row, col_span=5)
     row = write_header_row(ws_dash, ['Account Code', 'Account Name', 'Total Debits', 'Total Credits', 'Net'], row)
 
-    consolidated = {}
-    for jresult in journal_results.values():
-        for _, r in jresult['summary'].iterrows():
-            code = int(r['Account Code'])
-            if code not in consolidated:
-                consolidated[code] = {'debit': 0, 'credit': 0}
-            consolidated[code]['debit'] += r['debit_total']
-            consolidated[code]['credit'] += r['credit_total']
-
-    for code in sorted(consolidated.keys()):
-        acct = coa.get_account(code)
-        name = acct['name'] if acct else f'Account {code}'
-        dr = consolidated[code]['debit']
-        cr = consolidated[code]['credit']
-        row = write_data_row(ws_dash, [code, name, dr, cr, dr - cr], row)
+    # All journals' account summaries stacked and totalled per account code
+    if journal_results:
+        consolidated = pd.concat(
+            [j['summary'][['Account Code', 'debit_total', 'credit_total']]
+             for j in journal_results.values()],
+            ignore_index=True,
+        ).groupby('Account Code').sum()
+        for code, dr, cr in consolidated.itertuples(name=None):
+            code = int(code)
+            acct = coa.get_account(code)
+            name = acct['name'] if acct else f'Account {code}'
+            row = write_data_row(ws_dash, [code, name, dr, cr, dr - cr], row)
 
     auto_fit_columns(ws_dash)
     freeze_panes(ws_dash)
@@ -376,8 +396,7 @@ def main(journals_dir, period_start, period_end, output_file, master_dir=None):
         ws_exc = add_sheet(wb, 'Exceptions', tab_color='FF0000')
         row = write_title(ws_exc, 'Exceptions & Flags')
         row = write_header_row(ws_exc, ['Journal', 'Issue', 'Details'], row)
-        for exc in exceptions:
-            row = write_data_row(ws_exc, [exc['Journal'], exc['Issue'], exc['Details']], row)
+        row = write_data_rows(ws_exc, exceptions, row)
         auto_fit_columns(ws_exc)
 
     save_workbook(wb, output_file)
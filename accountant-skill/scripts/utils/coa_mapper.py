@@ -1,9 +1,19 @@
 """
 Chart of Accounts Mapper — Lookup and classify accounts.
 """
+from bisect import bisect_right
+
 import pandas as pd
+from openpyxl import load_workbook
 from pathlib import Path
 
+from .file_cache import cache_path, load_cached, save_cached
+
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
+
 
 # Default account classification based on 5-digit code ranges
 # Matches K&K Finance Chart of Accounts structure
@@ -82,6 +92,46 @@ CONTRA_ACCOUNTS = {
 }
 
 
+def _build_range_index(classifications):
+    """
+    Flatten possibly-overlapping (lo, hi) ranges into sorted, disjoint
+    [start, next_start) intervals, each resolved to the first range that
+    contains it — the answer a linear scan in dict order would give.
+    """
+    bounds = sorted({b for lo, hi in classifications for b in (lo, hi + 1)})
+    infos = []
+    for start in bounds[:-1]:
+        infos.append(next((info for (lo, hi), info in classifications.items()
+                           if lo <= start <= hi), None))
+    return bounds, infos
+
+
+# Default classification lookup by bisection instead of scanning every range
+_RANGE_BOUNDS, _RANGE_INFOS = _build_range_index(DEFAULT_CLASSIFICATIONS)
+
+
+def _read_sheet_rows(filepath):
+    """
+    Return the first sheet's rows as lists of plain values (None for blanks).
+
+    Uses python-calamine when installed (one native call for the whole sheet),
+    otherwise openpyxl in read-only/values-only mode. The COA is static
+    reference data, so no styles or formulas are needed.
+    """
+    if CalamineWorkbook is not None:
+        sheet = CalamineWorkbook.from_path(str(filepath)).get_sheet_by_index(0)
+        # calamine returns '' for blanks and floats for whole numbers
+        return [[None if v == '' else int(v) if isinstance(v, float) and v.is_integer() else v
+                 for v in row]
+                for row in sheet.to_python(skip_empty_area=True)]
+
+    wb = load_workbook(filepath, read_only=True, data_only=True, keep_links=False)
+    try:
+        return [list(row) for row in wb.worksheets[0].iter_rows(values_only=True)]
+    finally:
+        wb.close()
+
+
 class COAMapper:
     """Chart of Accounts lookup and classification."""
     
@@ -92,6 +142,7 @@ class COAMapper:
         """
         self.coa_df = None
         self.coa_dict = {}
+        self._account_cache = {}   # code → get_account() result
         
         if coa_filepath:
             self.load_coa(coa_filepath)
@@ -102,16 +153,25 @@ class COAMapper:
         if not filepath.exists():
             print(f"Warning: COA file not found: {filepath}. Using defaults.")
             return
-        
+
+        self._account_cache.clear()
+        # Parsed COA workbooks are cached, keyed by the file and this parser
+        cache_file = cache_path('coa', filepath, COAMapper.load_coa)
+        cached = load_cached(cache_file)
+        if cached is not None:
+            self.coa_df, self.coa_dict = cached
+            return
+
         try:
-            df = pd.read_excel(filepath)
+            rows = [r for r in _read_sheet_rows(filepath) if any(v is not None for v in r)]
             # Normalize column names
-            df.columns = [str(c).strip().lower() for c in df.columns]
-            
+            columns = [str(c).strip().lower() for c in rows[0]] if rows else []
+            records = rows[1:]
+
             # Try to find account code column
             code_col = None
             for candidate in ['account code', 'code', 'acct code', 'no.', 'account_code']:
-                if candidate in df.columns:
+                if candidate in columns:
                     code_col = candidate
                     break
             
@@ -121,24 +181,27 @@ class COAMapper:
             
             name_col = None
             for candidate in ['account name', 'name', 'description', 'account']:
-                if candidate in df.columns:
+                if candidate in columns:
                     name_col = candidate
                     break
-            
-            self.coa_df = df
-            for _, row in df.iterrows():
+
+            self.coa_df = pd.DataFrame(records, columns=columns)
+            attr_cols = [c for c in ['type', 'sub-type', 'sub_type', 'subtype', 'normal balance', 'normal_balance', 'status']
+                         if c in columns]
+            opening_col = 'opening balance' if 'opening balance' in columns else None
+            for values in records:
+                row = dict(zip(columns, values))
                 code = int(row[code_col]) if pd.notna(row[code_col]) else None
                 if code is None:
                     continue
                 entry = {'code': code}
                 if name_col:
                     entry['name'] = str(row[name_col]) if pd.notna(row[name_col]) else ''
-                for col in ['type', 'sub-type', 'sub_type', 'subtype', 'normal balance', 'normal_balance', 'status']:
-                    if col in df.columns and pd.notna(row[col]):
+                for col in attr_cols:
+                    if pd.notna(row[col]):
                         key = col.replace('-', '_').replace(' ', '_')
                         entry[key] = str(row[col])
                 # Load opening balance
-                opening_col = 'opening balance' if 'opening balance' in df.columns else None
                 if opening_col and pd.notna(row[opening_col]):
                     entry['opening_balance'] = float(row[opening_col])
                 else:
@@ -146,7 +209,9 @@ class COAMapper:
                 self.coa_dict[code] = entry
         except Exception as e:
             print(f"Warning: Error loading COA: {e}. Using defaults.")
-    
+            return
+        save_cached(cache_file, (self.coa_df, self.coa_dict))
+
     def get_account(self, code):
         """
         Get account info by code.
@@ -156,7 +221,15 @@ class COAMapper:
             code = int(code)
         except (ValueError, TypeError):
             return None
-        
+
+        # Lookups repeat heavily across a run; callers treat the result as read-only
+        if code in self._account_cache:
+            return self._account_cache[code]
+        result = self._account_cache[code] = self._lookup_account(code)
+        return result
+
+    def _lookup_account(self, code):
+        """Build the get_account() result for an int code."""
         # Check loaded COA first
         if code in self.coa_dict:
             info = self.coa_dict[code]
@@ -206,9 +279,9 @@ class COAMapper:
         return self._get_range_default(code)
     
     def _get_range_default(self, code):
-        for (lo, hi), info in DEFAULT_CLASSIFICATIONS.items():
-            if lo <= code <= hi:
-                return info
+        i = bisect_right(_RANGE_BOUNDS, code) - 1
+        if 0 <= i < len(_RANGE_INFOS):
+            return _RANGE_INFOS[i]
         return None
     
     def get_normal_balance(self, code):
@@ -4,6 +4,14 @@ Excel Reader Utility — Standardized .xlsx reading with flexible column matchin
 import pandas as pd
 import os
 from pathlib import Path
+from openpyxl import load_workbook
+
+try:
+    import python_calamine  # noqa: F401
+    XLSX_ENGINE = 'calamine'
+except ImportError:
+    # pandas' openpyxl engine already opens workbooks read_only/data_only
+    XLSX_ENGINE = 'openpyxl'
 
 
 # Column name aliases for flexible matching
@@ -140,17 +148,52 @@ def read_xlsx(filepath, sheet_name=0, required_columns=None, optional_columns=No
 
 
 def read_all_sheets(filepath):
-    """Read all sheets from an xlsx file into a dict of DataFrames."""
+    """
+    Read all sheets from an xlsx file into a dict of DataFrames.
+
+    Uses the calamine engine for .xlsx files when python-calamine is installed
+    (much faster on large ledgers), otherwise pandas' openpyxl engine.
+    """
     filepath = Path(filepath)
     if not filepath.exists():
         return {'data': None, 'error': f"File not found: {filepath}"}
+    engine = XLSX_ENGINE if filepath.suffix.lower() == '.xlsx' else None
     try:
-        sheets = pd.read_excel(filepath, sheet_name=None)
+        sheets = pd.read_excel(filepath, sheet_name=None, engine=engine)
         return {'data': sheets, 'error': None}
     except Exception as e:
         return {'data': None, 'error': f"Error reading {filepath}: {str(e)}"}
 
 
+def read_single_sheet(filepath):
+    """
+    Read a single-sheet .xlsx file into a DataFrame in one read-only pass.
+
+    The first non-blank row is the header. Returns the same dict shape as
+    read_all_sheets, with an error when the workbook holds more than one sheet.
+    """
+    filepath = Path(filepath)
+    if not filepath.exists():
+        return {'data': None, 'error': f"File not found: {filepath}"}
+    try:
+        wb = load_workbook(filepath, read_only=True, data_only=True, keep_links=False)
+        try:
+            if len(wb.sheetnames) != 1:
+                return {'data': None,
+                        'error': f"Expected one sheet in {filepath}, found {len(wb.sheetnames)}"}
+            rows = [r for r in wb.worksheets[0].iter_rows(values_only=True)
+                    if any(v is not None for v in r)]
+        finally:
+            wb.close()
+    except Exception as e:
+        return {'data': None, 'error': f"Error reading {filepath}: {str(e)}"}
+
+    if not rows:
+        return {'data': pd.DataFrame(), 'error': None}
+    columns = [c if c is not None else f'Unnamed: {i}' for i, c in enumerate(rows[0])]
+    return {'data': pd.DataFrame(rows[1:], columns=columns), 'error': None}
+
+
 def find_xlsx_files(directory, pattern=None):
     """Find all .xlsx files in a directory, optionally matching a pattern."""
     directory = Path(directory)
@@ -163,8 +206,11 @@ def find_xlsx_files(directory, pattern=None):
 
 
 def filter_by_period(df, date_column, start_date, end_date):
-    """Filter DataFrame rows to a date range."""
-    df = df.copy()
-    df[date_column] = pd.to_datetime(df[date_column], errors='coerce')
-    mask = (df[date_column] >= pd.Timestamp(start_date)) & (df[date_column] <= pd.Timestamp(end_date))
-    return df[mask]
+    """
+    Filter DataFrame rows to a date range. Returns a new frame with
+    date_column converted to datetimes; df itself is left unchanged.
+    """
+    # Only the rows in the period are copied, not the whole frame
+    dates = pd.to_datetime(df[date_column], errors='coerce')
+    mask = (dates >= pd.Timestamp(start_date)) & (dates <= pd.Timestamp(end_date))
+    return df[mask].assign(**{date_column: dates[mask]})
@@ -1,9 +1,18 @@
 """
 Excel Writer Utility — Professional .xlsx output with consistent formatting.
 """
+import weakref
+from copy import copy
+
 from openpyxl import Workbook
+from openpyxl.cell import Cell
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, numbers
 from openpyxl.utils import get_column_letter
+from openpyxl.worksheet.cell_range import CellRange
+# StreamingWorksheet subclasses openpyxl's private write-only worksheet and
+# add_sheet() registers it through Workbook._add_sheet(); neither is public
+# API, so the install instructions pin openpyxl to the tested 3.1 series.
+from openpyxl.worksheet._write_only import WriteOnlyWorksheet
 
 
 # Standard colors
@@ -17,6 +26,9 @@ SECTION_FONT = Font(bold=True, size=11, name='Arial', color='1F4E79')
 NORMAL_FONT = Font(size=11, name='Arial')
 TOTAL_FONT = Font(bold=True, size=11, name='Arial')
 NEGATIVE_FONT = Font(size=11, name='Arial', color='FF0000')
+TOTAL_NEGATIVE_FONT = Font(bold=True, size=11, name='Arial', color='FF0000')
+PASS_FONT = Font(bold=True, size=11, name='Arial', color='006100')
+FAIL_FONT = Font(bold=True, size=11, name='Arial', color='9C0006')
 PASS_FILL = PatternFill('solid', fgColor='C6EFCE')
 FAIL_FILL = PatternFill('solid', fgColor='FFC7CE')
 WARNING_FILL = PatternFill('solid', fgColor='FFEB9C')
@@ -28,22 +40,134 @@ THIN_BORDER = Border(
 BOTTOM_BORDER = Border(bottom=Side(style='medium'))
 DOUBLE_BOTTOM = Border(bottom=Side(style='double'))
 
+# Shared alignments (styles are immutable, so one instance serves every cell)
+LEFT_ALIGN = Alignment(horizontal='left')
+RIGHT_ALIGN = Alignment(horizontal='right')
+CENTER_ALIGN = Alignment(horizontal='center')
+HEADER_ALIGN = Alignment(horizontal='center', vertical='center', wrap_text=True)
+
 NUMBER_FORMAT = '#,##0'
 NUMBER_FORMAT_NEG = '#,##0;(#,##0);"-"'
 PERCENT_FORMAT = '0.0%'
 DATE_FORMAT = 'YYYY-MM-DD'
 
+STREAM_FLUSH_ROWS = 1000  # Rows held per block by a sheet passed to stream_sheet()
+
+
+class StreamingWorksheet(WriteOnlyWorksheet):
+    """
+    Write-only worksheet that keeps the cell()/merge_cells() API used by the
+    helpers in this module.
+
+    Cells are buffered per row and streamed to disk in row order by flush(),
+    which add_sheet() calls when the next sheet is started and openpyxl calls
+    on save. Rows that have been flushed can no longer be changed.
+
+    openpyxl writes the sheet's layout (freeze panes, column widths) when the
+    first row is streamed, so by default a sheet is held until it is finished.
+    Sheets marked with stream_sheet() are instead streamed in blocks by
+    write_data_rows() once they outgrow flush_every rows.
+
+    The longest value written to each column is tracked as cells are set, so
+    auto_fit_columns() does not have to walk the sheet again.
+    """
+
+    def __init__(self, parent, title):
+        super().__init__(parent, title)
+        self._buffer = {}        # row -> {col: Cell}
+        self._flushed_row = 0
+        self._last_row = 0
+        self._first_col = None
+        self._last_col = 0
+        self.content_widths = {}   # col -> len(str(value)) of longest value
+        self.flush_every = None    # set by stream_sheet()
+
+    def _extend(self, max_row, min_col, max_col):
+        self._last_row = max(self._last_row, max_row)
+        self._last_col = max(self._last_col, max_col)
+        if self._first_col is None or min_col < self._first_col:
+            self._first_col = min_col
+
+    @property
+    def max_row(self):
+        return max(self._last_row, 1)
+
+    @property
+    def min_column(self):
+        return self._first_col or 1
+
+    @property
+    def max_column(self):
+        return max(self._last_col, 1)
+
+    def cell(self, row, column, value=None):
+        if row <= self._flushed_row:
+            raise ValueError(f"Row {row} of '{self.title}' has already been written")
+        cells = self._buffer.setdefault(row, {})
+        cell = cells.get(column)
+        if cell is None:
+            cell = cells[column] = Cell(self, row=row, column=column)
+            self._extend(row, column, column)
+        if value is not None:
+            cell.value = value
+            if value:
+                length = len(value) if type(value) is str else len(str(value))
+                if length > self.content_widths.get(column, 0):
+                    self.content_widths[column] = length
+        return cell
+
+    def merge_cells(self, range_string=None, start_row=None, start_column=None,
+                    end_row=None, end_column=None):
+        cr = CellRange(range_string=range_string, min_col=start_column, min_row=start_row,
+                       max_col=end_column, max_row=end_row)
+        self.merged_cells.add(cr)
+        self._extend(cr.max_row, cr.min_col, cr.max_col)
+
+    @property
+    def columns(self):
+        """Buffered cells by column, from min_column to max_column."""
+        rows = [self._buffer[r] for r in sorted(self._buffer)]
+        for col in range(self.min_column, self.max_column + 1):
+            yield tuple(cells[col] for cells in rows if col in cells)
+
+    def flush(self, upto_row=None):
+        """Stream buffered rows (all of them, or those up to upto_row) to the
+        underlying write-only sheet."""
+        last = self._last_row if upto_row is None else min(upto_row, self._last_row)
+        for r in range(self._flushed_row + 1, last + 1):
+            cells = self._buffer.pop(r, {})
+            self.append([cells.get(c) for c in range(1, max(cells, default=0) + 1)])
+        self._flushed_row = max(self._flushed_row, last)
+
+    def close(self):
+        self.flush()
+        super().close()
 
-def create_workbook():
-    """Create a new workbook with default settings."""
-    wb = Workbook()
-    wb.remove(wb.active)
+
+def create_workbook(write_only=False):
+    """
+    Create a new workbook with default settings.
+
+    With write_only=True, sheets from add_sheet() are StreamingWorksheets:
+    rows are written to disk as each sheet is finished instead of being held
+    as Cell objects until save.
+    """
+    wb = Workbook(write_only=write_only)
+    if not write_only:
+        wb.remove(wb.active)
     return wb
 
 
 def add_sheet(wb, name, tab_color=None):
     """Add a sheet with optional tab color. Returns the worksheet."""
-    ws = wb.create_sheet(title=name[:31])  # Excel max sheet name = 31 chars
+    if wb.write_only:
+        for prev in wb.worksheets:
+            if isinstance(prev, StreamingWorksheet):
+                prev.flush()
+        ws = StreamingWorksheet(parent=wb, title=name[:31])
+        wb._add_sheet(ws)
+    else:
+        ws = wb.create_sheet(title=name[:31])  # Excel max sheet name = 31 chars
     if tab_color:
         ws.sheet_properties.tabColor = tab_color
     return ws
@@ -55,21 +179,21 @@ def write_title(ws, title, subtitle=None, period=None, start_row=1):
     ws.merge_cells(start_row=row, start_column=1, end_row=row, end_column=8)
     cell = ws.cell(row=row, column=1, value=title)
     cell.font = TITLE_FONT
-    cell.alignment = Alignment(horizontal='center')
+    cell.alignment = CENTER_ALIGN
     row += 1
 
     if subtitle:
         ws.merge_cells(start_row=row, start_column=1, end_row=row, end_column=8)
         cell = ws.cell(row=row, column=1, value=subtitle)
         cell.font = SUBTITLE_FONT
-        cell.alignment = Alignment(horizontal='center')
+        cell.alignment = CENTER_ALIGN
         row += 1
 
     if period:
         ws.merge_cells(start_row=row, start_column=1, end_row=row, end_column=8)
         cell = ws.cell(row=row, column=1, value=period)
         cell.font = PERIOD_FONT
-        cell.alignment = Alignment(horizontal='center')
+        cell.alignment = CENTER_ALIGN
         row += 1
 
     row += 1  # blank row after title
@@ -82,30 +206,85 @@ def write_header_row(ws, headers, row, start_col=1):
         cell = ws.cell(row=row, column=start_col + i, value=header)
         cell.font = HEADER_FONT
         cell.fill = HEADER_FILL
-        cell.alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
+        cell.alignment = HEADER_ALIGN
         cell.border = THIN_BORDER
     return row + 1
 
 
-def write_data_row(ws, values, row, start_col=1, number_cols=None, font=None, border=None):
-    """Write a data row with formatting."""
+# Workbook -> {style key: StyleArray} for write_data_row()
+_row_styles = weakref.WeakKeyDictionary()
+
+
+def write_data_row(ws, values, row, start_col=1, number_cols=None, font=None, border=None,
+                   cell_overrides=None):
+    """
+    Write a data row with formatting.
+
+    cell_overrides maps a column index to style attributes (font, alignment,
+    number_format, ...) that replace the defaults for that cell.
+    """
     if number_cols is None:
         number_cols = []
+    font = font or NORMAL_FONT
+    border = border or THIN_BORDER
+    styles = _row_styles.setdefault(ws.parent, {})
     for i, val in enumerate(values):
-        cell = ws.cell(row=row, column=start_col + i, value=val)
-        cell.font = font or NORMAL_FONT
-        cell.border = border or THIN_BORDER
         col_idx = start_col + i
-        if col_idx in number_cols or (isinstance(val, (int, float)) and i > 0):
+        cell = ws.cell(row=row, column=col_idx, value=val)
+        is_number = isinstance(val, (int, float))
+        numeric = col_idx in number_cols or (is_number and i > 0)
+        cell_font = NEGATIVE_FONT if numeric and is_number and val < 0 else font
+        overrides = cell_overrides.get(col_idx) if cell_overrides else None
+
+        # Each font/border/alignment combination is resolved against the
+        # workbook's style tables once; later cells copy the result
+        key = (id(cell_font), id(border), numeric, id(overrides))
+        fresh = not cell.has_style
+        if fresh and key in styles:
+            cell._style = copy(styles[key][0])
+            continue
+
+        cell.font = cell_font
+        cell.border = border
+        if numeric:
             cell.number_format = NUMBER_FORMAT_NEG
-            cell.alignment = Alignment(horizontal='right')
-            if isinstance(val, (int, float)) and val < 0:
-                cell.font = NEGATIVE_FONT
+            cell.alignment = RIGHT_ALIGN
         else:
-            cell.alignment = Alignment(horizontal='left')
+            cell.alignment = LEFT_ALIGN
+        if overrides:
+            for attr, attr_value in overrides.items():
+                setattr(cell, attr, attr_value)
+        if fresh:
+            # Keep the keyed objects alive so their ids are not reused
+            styles[key] = (copy(cell._style), cell_font, border, overrides)
     return row + 1
 
 
+def write_data_rows(ws, rows, row, start_col=1, number_cols=None, font=None, border=None):
+    """Write a block of data rows (any iterable of value lists) with the same formatting."""
+    number_cols = frozenset(number_cols or ())
+    flush_every = getattr(ws, 'flush_every', None)
+    for values in rows:
+        row = write_data_row(ws, values, row, start_col, number_cols, font, border)
+        if flush_every and row - ws._flushed_row > flush_every:
+            if not ws._flushed_row:
+                auto_fit_columns(ws)   # last chance before the layout is written
+            ws.flush(row - 1)
+    return row
+
+
+def stream_sheet(ws, flush_every=STREAM_FLUSH_ROWS):
+    """
+    Let write_data_rows() stream a long detail sheet in blocks instead of
+    holding it until the sheet is finished. Set freeze panes before writing
+    rows; if the sheet does outgrow one block, its column widths are fitted to
+    the rows written before the first block goes out. No-op on normal sheets.
+    """
+    if isinstance(ws, StreamingWorksheet):
+        ws.flush_every = flush_every
+    return ws
+
+
 def write_section_header(ws, text, row, col_span=8, start_col=1):
     """Write a section header row (e.g., 'REVENUE', 'OPERATING EXPENSES')."""
     ws.merge_cells(start_row=row, start_column=start_col, end_row=row, end_column=start_col + col_span - 1)
@@ -126,18 +305,26 @@ def write_total_row(ws, label, values, row, start_col=1, double_line=False):
         cell = ws.cell(row=row, column=start_col + 1 + i, value=val)
         cell.font = TOTAL_FONT
         cell.number_format = NUMBER_FORMAT_NEG
-        cell.alignment = Alignment(horizontal='right')
+        cell.alignment = RIGHT_ALIGN
         cell.border = border
         if isinstance(val, (int, float)) and val < 0:
-            cell.font = Font(bold=True, size=11, name='Arial', color='FF0000')
+            cell.font = TOTAL_NEGATIVE_FONT
     return row + 1
 
 
 def auto_fit_columns(ws, min_width=12, max_width=50):
     """Auto-fit column widths based on content."""
-    for col in ws.columns:
+    if isinstance(ws, StreamingWorksheet):
+        # Lengths were recorded as the cells were written
+        lengths = ws.content_widths
+        for col_idx in range(ws.min_column, ws.max_column + 1):
+            adjusted_width = min(max(lengths.get(col_idx, 0) + 2, min_width), max_width)
+            ws.column_dimensions[get_column_letter(col_idx)].width = adjusted_width
+        return
+
+    for col_idx, col in enumerate(ws.columns, ws.min_column):
         max_length = 0
-        col_letter = get_column_letter(col[0].column)
+        col_letter = get_column_letter(col_idx)
         for cell in col:
             if cell.value:
                 length = len(str(cell.value))
@@ -152,12 +339,14 @@ def freeze_panes(ws, row=2, col=2):
     ws.freeze_panes = f"{get_column_letter(col)}{row}"
 
 
-def write_validation_result(ws, row, col, passed):
+def write_validation_result(ws, row, col, passed, border=None):
     """Write a PASS/FAIL cell."""
     cell = ws.cell(row=row, column=col, value='PASS' if passed else 'FAIL')
-    cell.font = Font(bold=True, size=11, name='Arial', color='006100' if passed else '9C0006')
+    cell.font = PASS_FONT if passed else FAIL_FONT
     cell.fill = PASS_FILL if passed else FAIL_FILL
-    cell.alignment = Alignment(horizontal='center')
+    cell.alignment = CENTER_ALIGN
+    if border is not None:
+        cell.border = border
     return row
 
 
@@ -0,0 +1,107 @@
+"""
+File Cache Utility — Reuse parsed workbook data.
+
+Entries are kept in memory for the current process. Setting
+WORKSPACE_ACCOUNTANT_CACHE to a directory opts in to pickling them there so
+later runs can reuse them; entries are unpickled on load, so only point it
+at a directory you trust.
+
+Entries are keyed by the source file's path, mtime and size, by the parser
+that produced them (its name and the mtime of its module) and its arguments,
+and by CACHE_VERSION. Editing or replacing the workbook, changing the read
+arguments or editing the parsing module all invalidate the entry; bump
+CACHE_VERSION for parsing changes made elsewhere (e.g. in a helper module).
+"""
+import hashlib
+import os
+import pickle
+import sys
+from pathlib import Path
+
+
+CACHE_DIR = (Path(os.environ['WORKSPACE_ACCOUNTANT_CACHE'])
+             if os.environ.get('WORKSPACE_ACCOUNTANT_CACHE') else None)
+
+CACHE_VERSION = 1   # Bump when the shape or parsing of cached results changes
+
+_memo = {}   # cache file -> pickled entry, for reuse within this process
+
+
+def _parser_id(parser):
+    """Qualified name of parser plus the mtime of the module defining it."""
+    module = sys.modules.get(parser.__module__)
+    source = getattr(module, '__file__', None)
+    try:
+        source_mtime = os.stat(source).st_mtime_ns if source else 0
+    except OSError:
+        source_mtime = 0
+    return f"{parser.__module__}.{parser.__qualname__}@{source_mtime}"
+
+
+def cache_path(prefix, filepath, parser, params=()):
+    """
+    Cache file for filepath as parsed by parser(filepath, **params); changes
+    whenever the file, the parser's module, params or CACHE_VERSION do.
+    Without a CACHE_DIR the name only keys the in-process entries.
+    """
+    filepath = Path(filepath)
+    st = filepath.stat()
+    key = (f"v{CACHE_VERSION}|{filepath.resolve()}|{st.st_mtime_ns}|{st.st_size}|"
+           f"{_parser_id(parser)}|{sorted(dict(params).items())!r}")
+    name = f"{prefix}_{hashlib.sha1(key.encode()).hexdigest()[:16]}.pkl"
+    return CACHE_DIR / name if CACHE_DIR is not None else Path(name)
+
+
+def load_cached(cache_file):
+    """
+    Return a fresh copy of the cached object, or None on a miss or unreadable
+    entry. The disk is only consulted when CACHE_DIR is set.
+    """
+    blob = _memo.get(cache_file)
+    if blob is None and CACHE_DIR is not None:
+        try:
+            blob = _memo[cache_file] = cache_file.read_bytes()
+        except OSError:
+            return None
+    if blob is None:
+        return None
+    try:
+        return pickle.loads(blob)
+    except Exception:
+        return None
+
+
+def save_cached(cache_file, obj):
+    """
+    Keep obj for this process and, when CACHE_DIR is set, write it there.
+    Disk writes are best-effort; a read-only cache dir is not an error.
+    """
+    blob = _memo[cache_file] = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+    if CACHE_DIR is None:
+        return
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_suffix(f'.{os.getpid()}.tmp')
+        tmp.write_bytes(blob)
+        os.replace(tmp, cache_file)
+    except OSError:
+        pass
+
+
+def cached_read(prefix, read, filepath, **kwargs):
+    """
+    Return read(filepath, **kwargs), reusing the cached result while the file,
+    the reader and its arguments are unchanged. read() returns the usual
+    {'data', 'error'} dict; only results without an error are cached.
+    """
+    try:
+        cache_file = cache_path(prefix, filepath, read, kwargs)
+    except OSError:
+        return read(filepath, **kwargs)   # missing file: let the reader report it
+
+    result = load_cached(cache_file)
+    if result is None:
+        result = read(filepath, **kwargs)
+        if not result.get('error'):
+            save_cached(cache_file, result)
+    return result
@@ -276,10 +276,20 @@ class PCCCMapper:
 
     # ── Summarization helpers ─────────────────────────────────────────────────
 
+    def _segment_of(self, account):
+        """classify_account() for a raw journal cell; unparseable → 'unknown'."""
+        try:
+            return self.classify_account(int(float(str(account))))
+        except (ValueError, TypeError):
+            return 'unknown'
+
     def build_pc_summary(self, journal_dfs):
         """
         Build a profit center P&L summary from all journal DataFrames.
 
+        The tagged rows of every journal are stacked into one frame and each
+        summary is a single groupby over it.
+
         Returns:
             pc_summary  — dict { pc_code: { revenue, cogs, opex, nonop } }
             cc_summary  — dict { cc_code: { debits, credits } }
@@ -291,53 +301,52 @@ class PCCCMapper:
         cc_summary = {cc: {'debits': 0.0, 'credits': 0.0}
                       for cc in self.cost_centers}
 
+        parts = []
         for journal_name, df in journal_dfs.items():
             if df is None or len(df) == 0:
                 continue
             if 'Profit Center' not in df.columns:
                 continue
 
-            if '_debit' not in df.columns:
-                if 'Debit Amount' in df.columns and 'Credit Amount' in df.columns:
-                    df = df.copy()
-                    df['_debit']  = pd.to_numeric(df['Debit Amount'],  errors='coerce').fillna(0)
-                    df['_credit'] = pd.to_numeric(df['Credit Amount'], errors='coerce').fillna(0)
-                elif 'Amount' in df.columns:
-                    df = df.copy()
-                    df['_debit']  = pd.to_numeric(df['Amount'], errors='coerce').fillna(0)
-                    df['_credit'] = pd.to_numeric(df['Amount'], errors='coerce').fillna(0)
-                else:
-                    continue
-
-            for _, row in df.iterrows():
-                pc = _clean(row.get('Profit Center', ''))
-                cc = _clean(row.get('Cost Center',   ''))
-                dr_amt = float(row.get('_debit',  0) or 0)
-                cr_amt = float(row.get('_credit', 0) or 0)
-
-                try:
-                    dr_code = int(float(str(row.get('Debit Account', 0))))
-                    dr_seg  = self.classify_account(dr_code)
-                except (ValueError, TypeError):
-                    dr_seg = 'unknown'
-
-                try:
-                    cr_code = int(float(str(row.get('Credit Account', 0))))
-                    cr_seg  = self.classify_account(cr_code)
-                except (ValueError, TypeError):
-                    cr_seg = 'unknown'
-
-                if pc in pc_summary:
-                    if cr_seg == 'revenue':
-                        pc_summary[pc]['revenue'] += cr_amt
-                    if dr_seg == 'revenue_contra':
-                        pc_summary[pc]['revenue'] -= dr_amt
-                    for seg in ('cogs', 'opex', 'nonop'):
-                        if dr_seg == seg:
-                            pc_summary[pc][seg] += dr_amt
-
-                if cc in cc_summary:
-                    cc_summary[cc]['debits']  += dr_amt
-                    cc_summary[cc]['credits'] += cr_amt
+            if '_debit' in df.columns:
+                debit, credit = df['_debit'], df['_credit']
+            elif 'Debit Amount' in df.columns and 'Credit Amount' in df.columns:
+                debit = pd.to_numeric(df['Debit Amount'], errors='coerce').fillna(0)
+                credit = pd.to_numeric(df['Credit Amount'], errors='coerce').fillna(0)
+            elif 'Amount' in df.columns:
+                debit = credit = pd.to_numeric(df['Amount'], errors='coerce').fillna(0)
+            else:
+                continue
+
+            parts.append(pd.DataFrame({
+                'pc': df['Profit Center'].map(_clean),
+                'cc': df['Cost Center'].map(_clean) if 'Cost Center' in df.columns else '',
+                'dr_seg': df['Debit Account'].map(self._segment_of) if 'Debit Account' in df.columns
+                          else self._segment_of(0),
+                'cr_seg': df['Credit Account'].map(self._segment_of) if 'Credit Account' in df.columns
+                          else self._segment_of(0),
+                'dr': pd.to_numeric(debit).astype(float),
+                'cr': pd.to_numeric(credit).astype(float),
+            }))
+
+        if not parts:
+            return pc_summary, cc_summary
+        rows = pd.concat(parts, ignore_index=True)
+
+        # Per-row P&L contributions, then one groupby per summary
+        dr, cr = rows['dr'], rows['cr']
+        segments = pd.DataFrame({
+            'pc': rows['pc'],
+            'revenue': cr.where(rows['cr_seg'] == 'revenue', 0.0)
+                       - dr.where(rows['dr_seg'] == 'revenue_contra', 0.0),
+            **{seg: dr.where(rows['dr_seg'] == seg, 0.0) for seg in ('cogs', 'opex', 'nonop')},
+        })
+        pc_totals = segments[segments['pc'].isin(list(pc_summary))].groupby('pc').sum()
+        for pc, totals in pc_totals.to_dict('index').items():
+            pc_summary[pc] = {seg: float(totals[seg]) for seg in ('revenue', 'cogs', 'opex', 'nonop')}
+
+        cc_totals = rows[rows['cc'].isin(list(cc_summary))].groupby('cc')[['dr', 'cr']].sum()
+        for cc, (debits, credits) in zip(cc_totals.index, cc_totals.itertuples(index=False, name=None)):
+            cc_summary[cc] = {'debits': float(debits), 'credits': float(credits)}
 
         return pc_summary, cc_summary